@@ -0,0 +1,44 @@
+"""Compare the parser backends available for each format on the same fixtures.
+
+Usage:
+    python -m benchmarks.bench_backends [--keys 20000] [--repeat 3]
+
+Optional backends (orjson, rtoml) are skipped when they are not installed.
+"""
+import argparse
+import importlib.util
+import tempfile
+
+from benchmarks.bench_parsers import throughput, write_fixtures, yaml_pure_python
+from ze.src.models import JSONParser, ORJSONParser, RTOMLParser, TOMLParser, YAMLParser
+
+BACKENDS = {
+    'json': [('json (stdlib)', JSONParser.parse, None), ('orjson', ORJSONParser.parse, 'orjson')],
+    'toml': [('tomllib (stdlib)', TOMLParser.parse, None), ('rtoml', RTOMLParser.parse, 'rtoml')],
+    'yaml': [('PyYAML libyaml', YAMLParser.parse, None), ('PyYAML pure python', yaml_pure_python, None)],
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--keys', type=int, default=20000)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        paths = write_fixtures(directory, args.keys)
+        for fmt, backends in BACKENDS.items():
+            results = []
+            for name, parse, module in backends:
+                if module and importlib.util.find_spec(module) is None:
+                    print(f'{fmt:<5} {name:<20} not installed')
+                    continue
+                results.append((name, throughput(parse, paths[fmt], args.repeat)))
+
+            baseline = results[0][1]
+            for name, mb_per_s in results:
+                print(f'{fmt:<5} {name:<20} {mb_per_s:9.2f} MB/s  {mb_per_s / baseline:5.2f}x')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,51 @@
+"""ENVParser vs. python-dotenv on a large generated .env file.
+
+Usage:
+    python -m benchmarks.bench_env [--entries 50000] [--repeat 3]
+"""
+import argparse
+import os
+import tempfile
+
+from dotenv import dotenv_values
+
+from ze.src.models import ENVParser
+from ze.src.timing import best_of
+
+
+def write_fixture(file_path: str, entries: int):
+    """Write `entries` assignments mixing the supported syntaxes."""
+    with open(file_path, 'w', encoding='utf-8') as file:
+        for index in range(entries):
+            match index % 4:
+                case 0:
+                    file.write(f'SECRET_{index}=s3cr3t-{index}\n')
+                case 1:
+                    file.write(f'export TOKEN_{index}="tok\\n{index}"  # rotated\n')
+                case 2:
+                    file.write(f"PATTERN_{index}='^[a-z]+{index}$'\n")
+                case _:
+                    file.write(f'# comment {index}\nURL_{index} = https://host/{index} # inline\n')
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--entries', type=int, default=50_000)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        file_path = os.path.join(directory, '.env')
+        write_fixture(file_path, args.entries)
+        assert ENVParser.parse(file_path) == dotenv_values(file_path, interpolate=False)
+
+        ours = best_of(lambda: ENVParser.parse(file_path), args.repeat)
+        theirs = best_of(lambda: dotenv_values(file_path, interpolate=False), args.repeat)
+
+    print(f'entries={args.entries}')
+    print(f'ENVParser:     {ours * 1000:9.2f} ms')
+    print(f'python-dotenv: {theirs * 1000:9.2f} ms  ({theirs / ours:.1f}x slower)')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,50 @@
+"""Cold import time of `ze`, measured with `python -X importtime`.
+
+Usage:
+    python -m benchmarks.bench_import [--repeat 10] [--top 10] [--max-ms 50]
+
+Exits with status 1 when the best cumulative import time of `ze` exceeds
+--max-ms, so it can guard against import-time regressions.
+"""
+import argparse
+import subprocess
+import sys
+
+
+def import_times() -> dict:
+    """Run one cold import and return {module: (self_us, cumulative_us)}."""
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', 'import ze'], capture_output=True, text=True, check=True
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'imported package' in line:
+            continue
+        self_us, cumulative_us, module = line.removeprefix('import time:').split('|')
+        times[module.strip()] = (int(self_us), int(cumulative_us))
+    return times
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--repeat', type=int, default=10)
+    parser.add_argument('--top', type=int, default=10)
+    parser.add_argument('--max-ms', type=float, default=None)
+    args = parser.parse_args()
+
+    runs = [import_times() for _ in range(args.repeat)]
+    best = min(runs, key=lambda times: times['ze'][1])
+    total_ms = best['ze'][1] / 1000
+
+    print(f'import ze: {total_ms:.2f} ms (best of {args.repeat})')
+    print(f'{"self ms":>9} {"cumul ms":>9}  module')
+    for module, (self_us, cumulative_us) in sorted(best.items(), key=lambda item: -item[1][0])[: args.top]:
+        print(f'{self_us / 1000:9.2f} {cumulative_us / 1000:9.2f}  {module}')
+
+    if args.max_ms is not None and total_ms > args.max_ms:
+        print(f'import time {total_ms:.2f} ms exceeds the {args.max_ms} ms budget')
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,45 @@
+"""Per-call latency of ConfigManager.get for hits, misses with a default and misses that raise.
+
+Usage:
+    python -m benchmarks.bench_lookup [--number 1000000] [--repeat 5]
+"""
+import argparse
+import os
+import tempfile
+import timeit
+
+from ze.src.manager import ConfigManager
+from ze.src.settings import settings
+
+# Statements call the bound method the same way `from ze import config` does.
+CASES = {
+    'hit': "config('DATABASE_URL')",
+    'dotted hit': "config('database.primary.url')",
+    'miss with default': "config('MISSING_KEY', 'default')",
+    'miss that raises': "try:\n    config('MISSING_KEY')\nexcept KeyError:\n    pass",
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--number', type=int, default=1_000_000)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as base_dir:
+        with open(os.path.join(base_dir, 'config.yaml'), 'w', encoding='utf-8') as file:
+            file.write('DATABASE_URL: sqlite:///dev.db\ndatabase:\n  primary:\n    url: postgres://primary\n')
+        settings.BASE_DIR = base_dir
+        settings.CONF_DIR = os.path.join(base_dir, 'configs')
+        manager = ConfigManager()
+        manager._load_config_files()
+
+        namespace = {'config': manager.get}
+        for name, statement in CASES.items():
+            number = args.number // 10 if name == 'miss that raises' else args.number
+            best = min(timeit.repeat(statement, number=number, repeat=args.repeat, globals=namespace)) / number
+            print(f'{name:<20} {best * 1e9:8.1f} ns/call')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,111 @@
+"""Private memory of forked workers reading a large configuration, with and without settings.FREEZE.
+
+Every worker walks the whole configuration once, as a long running worker
+eventually does, then runs a full garbage collection. Reading an object updates
+its reference count and a collection writes to the header of every tracked
+object, both copy the touched pages out of the parent. The unique set size
+(USS) of a worker is the memory it no longer shares with the parent.
+
+Linux only, uses os.fork and psutil.
+
+Usage:
+    python -m benchmarks.bench_memory [--sections 20000] [--workers 4]
+"""
+import argparse
+import gc
+import json
+import os
+import tempfile
+
+import psutil
+
+from ze.src.manager import ConfigManager
+from ze.src.settings import settings
+
+
+def write_config(directory, sections):
+    """Write a JSON file with many small sections, like a service catalog."""
+    config = {
+        f'service_{number}': {
+            'url': f'https://service-{number}.internal:8443/api',
+            'timeout': '30s',
+            'retries': 3,
+            'enabled': True,
+            'tags': ['internal', 'http', f'team-{number % 50}'],
+            'limits': {'rps': 100, 'burst': 200},
+        }
+        for number in range(sections)
+    }
+    with open(os.path.join(directory, 'services.json'), 'w', encoding='utf-8') as file:
+        json.dump(config, file)
+
+
+def walk(value):
+    """Touch every object of the configuration, like a reader would."""
+    if isinstance(value, dict):
+        for item in value.values():
+            walk(item)
+    elif isinstance(value, (list, tuple)):
+        for item in value:
+            walk(item)
+
+
+def worker(manager, write_fd):
+    walk(manager._config_data)
+    gc.collect()
+    memory = psutil.Process().memory_full_info()
+    os.write(write_fd, f'{memory.rss} {memory.uss}\n'.encode())
+    os._exit(0)
+
+
+def measure(base_dir, freeze, workers):
+    """Load the configuration in a fresh process and fork the workers from it."""
+    read_fd, write_fd = os.pipe()
+    pid = os.fork()
+    if pid == 0:
+        os.close(read_fd)
+        settings.BASE_DIR = base_dir
+        settings.CONF_DIR = os.path.join(base_dir, 'configs')
+        settings.FREEZE = freeze
+        manager = ConfigManager()
+        manager._load_config_files()
+        children = []
+        for _ in range(workers):
+            child = os.fork()
+            if child == 0:
+                worker(manager, write_fd)
+            children.append(child)
+        for child in children:
+            os.waitpid(child, 0)
+        os._exit(0)
+
+    os.close(write_fd)
+    with os.fdopen(read_fd) as pipe:
+        samples = [tuple(map(int, line.split())) for line in pipe]
+    os.waitpid(pid, 0)
+    rss = sum(sample[0] for sample in samples) / len(samples)
+    uss = sum(sample[1] for sample in samples) / len(samples)
+    return rss, uss
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--sections', type=int, default=20_000)
+    parser.add_argument('--workers', type=int, default=4)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as base_dir:
+        write_config(base_dir, args.sections)
+        results = {}
+        for freeze in (False, True):
+            results[freeze] = measure(base_dir, freeze, args.workers)
+            rss, uss = results[freeze]
+            label = 'frozen' if freeze else 'default'
+            print(f'{label:<8} RSS {rss / 2**20:8.1f} MiB   USS {uss / 2**20:8.1f} MiB per worker')
+
+        saved = results[False][1] - results[True][1]
+        print(f'private memory saved: {saved / 2**20:.1f} MiB per worker ({saved / results[False][1]:.0%})')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,70 @@
+"""Shallow vs. deep merging of many overlapping layers, with and without provenance.
+
+Usage:
+    python -m benchmarks.bench_merge [--files 300] [--sections 100] [--keys 10] [--repeat 5]
+"""
+import argparse
+import random
+
+from ze.src.core import build_index, merge_layers, value_sources
+from ze.src.timing import best_of
+
+
+def make_layers(files: int, sections: int, keys: int) -> dict:
+    """Build `files` layers, each setting a random half of the same sections and keys."""
+    rng = random.Random(0)
+    layers = {}
+    for number in range(files):
+        data = {}
+        for section in rng.sample(range(sections), sections // 2):
+            data[f'section_{section}'] = {
+                f'key_{key}': f'value-{number}-{key}' for key in rng.sample(range(keys), keys // 2)
+            }
+            data[f'section_{section}']['hosts'] = [f'host-{number}']
+        layers[f'layer_{number:03}.json'] = (None, data)
+    return layers
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--files', type=int, default=300)
+    parser.add_argument('--sections', type=int, default=100)
+    parser.add_argument('--keys', type=int, default=10)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    layers = make_layers(args.files, args.sections, args.keys)
+    files = list(layers)
+    leaves = sum(len(section) for _, data in layers.values() for section in data.values())
+    print(f'files={args.files} leaves set={leaves}')
+
+    cases = [
+        ('shallow', {}),
+        ('shallow + provenance', {'provenance': True}),
+        ('deep', {'dicts': 'merge'}),
+        ('deep + provenance', {'dicts': 'merge', 'provenance': True}),
+        ('deep + append + provenance', {'dicts': 'merge', 'lists': 'append', 'provenance': True}),
+    ]
+    for name, case in cases:
+        options = dict(case)
+        record = options.pop('provenance', False)
+
+        def merge():
+            return merge_layers(files, layers, provenance={} if record else None, **options)
+
+        seconds = best_of(merge, args.repeat)
+        print(f'{name:28} {seconds * 1000:9.2f} ms')
+
+    provenance = {}
+    merged = merge_layers(files, layers, 'merge', provenance=provenance)
+    index_seconds = best_of(lambda: build_index(merged), args.repeat)
+    print(f'{"build_index (deep result)":28} {index_seconds * 1000:9.2f} ms')
+    print(f'provenance entries:          {len(provenance)}')
+    leaf = best_of(lambda: value_sources(provenance, 'section_0.key_0', files), args.repeat)
+    section = best_of(lambda: value_sources(provenance, 'section_0', files), args.repeat)
+    print(f'{"value_sources (leaf)":28} {leaf * 1000:9.3f} ms')
+    print(f'{"value_sources (section)":28} {section * 1000:9.3f} ms')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,60 @@
+"""Schema compilation and validation on a large generated configuration.
+
+Usage:
+    python -m benchmarks.bench_schema [--sections 1000] [--fields 10] [--repeat 5]
+"""
+import argparse
+
+from ze.src.core import build_index
+from ze.src.schema import Field, Schema
+from ze.src.timing import best_of
+
+
+def make_fixture(sections: int, fields: int):
+    """Build a schema and matching data with `sections` x `fields` keys."""
+    spec, data = {}, {}
+    for section in range(sections):
+        section_spec, section_data = {}, {}
+        for index in range(fields):
+            match index % 4:
+                case 0:
+                    section_spec[f'port_{index}'] = int
+                    section_data[f'port_{index}'] = 8000 + index
+                case 1:
+                    section_spec[f'url_{index}'] = str
+                    section_data[f'url_{index}'] = f'postgres://host/{section}'
+                case 2:
+                    section_spec[f'debug_{index}'] = Field(bool, False)
+                case _:
+                    section_spec[f'ratio_{index}'] = float
+                    section_data[f'ratio_{index}'] = '0.5'
+        spec[f'section_{section}'] = section_spec
+        data[f'section_{section}'] = section_data
+    return spec, data
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--sections', type=int, default=1000)
+    parser.add_argument('--fields', type=int, default=10)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    spec, data = make_fixture(args.sections, args.fields)
+    schema = Schema(spec)
+    validated = schema.validate(data)
+
+    compile_time = best_of(lambda: Schema(spec), args.repeat)
+    validate_time = best_of(lambda: schema.validate(data), args.repeat)
+    valid_time = best_of(lambda: schema.validate(validated), args.repeat)
+    index_time = best_of(lambda: build_index(validated), args.repeat)
+
+    print(f'keys={args.sections * args.fields}')
+    print(f'compile:                {compile_time * 1000:9.2f} ms (once per manager)')
+    print(f'validate (converting):  {validate_time * 1000:9.2f} ms')
+    print(f'validate (valid as is): {valid_time * 1000:9.2f} ms')
+    print(f'build_index:            {index_time * 1000:9.2f} ms')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,83 @@
+"""Peak memory and time of whole-document vs. streamed parsing of large files.
+
+Usage:
+    python -m benchmarks.bench_stream [--entries 200000] [--yaml-entries 50000]
+"""
+import argparse
+import json
+import os
+import tempfile
+import time
+import tracemalloc
+
+import yaml
+
+from ze.src.models import JSONParser, YAMLParser
+
+
+def make_fixture(entries: int) -> dict:
+    """Build a feature-flag like document with `entries` top-level sections."""
+    return {
+        f'flag_{index}': {
+            'enabled': index % 3 == 0,
+            'rollout': index % 100,
+            'owner': f'team-{index % 50}',
+            'routes': [f'/api/v{index % 4}/resource/{index}', f'/internal/{index}'],
+        }
+        for index in range(entries)
+    }
+
+
+def measure(parser, file_path: str, stream: bool):
+    """Parse `file_path`, returning the data, the seconds of an untraced parse and
+    the peak bytes allocated by a traced one."""
+    threshold = parser.stream_threshold
+    parser.stream_threshold = 0 if stream else None
+    try:
+        start = time.perf_counter()
+        data = parser.parse(file_path)
+        seconds = time.perf_counter() - start
+        del data
+        tracemalloc.start()
+        data = parser.parse(file_path)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    finally:
+        parser.stream_threshold = threshold
+    return data, seconds, peak
+
+
+def report(name: str, parser, file_path: str):
+    whole, whole_seconds, whole_peak = measure(parser, file_path, stream=False)
+    streamed, stream_seconds, stream_peak = measure(parser, file_path, stream=True)
+    assert whole == streamed
+    size = os.path.getsize(file_path) / 2**20
+    print(f'{name} ({size:.1f} MiB)')
+    print(f'  whole:    peak {whole_peak / 2**20:8.1f} MiB  {whole_seconds * 1000:9.1f} ms')
+    print(f'  streamed: peak {stream_peak / 2**20:8.1f} MiB  {stream_seconds * 1000:9.1f} ms')
+    print(f'  peak reduction: {(1 - stream_peak / whole_peak) * 100:.0f}%')
+    threshold = parser.stream_threshold
+    streamed_by_default = threshold is not None and os.path.getsize(file_path) >= threshold
+    print(f'  streamed by default: {"yes" if streamed_by_default else "no"}')
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--entries', type=int, default=200_000)
+    parser.add_argument('--yaml-entries', type=int, default=50_000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        json_path = os.path.join(directory, 'flags.json')
+        with open(json_path, 'w', encoding='utf-8') as file:
+            json.dump(make_fixture(args.entries), file, indent=2)
+        report('JSON', JSONParser, json_path)
+
+        yaml_path = os.path.join(directory, 'flags.yaml')
+        with open(yaml_path, 'w', encoding='utf-8') as file:
+            yaml.safe_dump(make_fixture(args.yaml_entries), file)
+        report('YAML', YAMLParser, yaml_path)
+
+
+if __name__ == '__main__':
+    main()
@@ -4,6 +4,7 @@ import tempfile
 
 import pytest
 
+from ze.src.core import clear_parse_cache
 from ze.src.manager import ConfigManager
 from ze.src.settings import settings
 
@@ -76,11 +77,17 @@ def create_test_file(file_path: str, content: str):
 
 
 @pytest.fixture(autouse=True)
-def reset_config_manager():
-    """Resets ConfigManager state before each test."""
-    ConfigManager._files_checked = False
-    ConfigManager._config_data = {}
-    ConfigManager._config_files = []
+def reset_parse_cache():
+    """Empties the process-wide parse cache shared by the managers before each test."""
+    clear_parse_cache()
+
+
+@pytest.fixture
+def manager():
+    """Provides a fresh ConfigManager reading the directories of settings."""
+    manager = ConfigManager()
+    yield manager
+    manager.stop_watching()
 
 
 @pytest.fixture
@@ -0,0 +1,41 @@
+import datetime
+
+import pytest
+
+from ze.src.artifact import load_artifact, save_artifact
+
+
+def test_artifact_round_trip(tmp_path):
+    """
+    Tests that an artifact returns the files and layers it was built from.
+
+    Args:
+        tmp_path: Temporary directory provided by pytest.
+    """
+    artifact_path = tmp_path / 'config.zeart'
+    layers = {'config.json': ((1, 2, 3), {'database': {'url': 'postgres://', 'hosts': ['a', 'b']}})}
+    save_artifact(artifact_path, ['config.json', 'notes.txt'], layers)
+
+    assert load_artifact(artifact_path) == (['config.json', 'notes.txt'], layers)
+
+
+def test_artifact_missing_corrupt_or_unmarshallable(tmp_path):
+    """
+    Tests that missing and corrupt artifacts load as None, and that data marshal
+    cannot encode is rejected without leaving a file behind.
+
+    Args:
+        tmp_path: Temporary directory provided by pytest.
+    """
+    artifact_path = tmp_path / 'config.zeart'
+    assert load_artifact(artifact_path) is None
+
+    artifact_path.write_bytes(b'not an artifact')
+    assert load_artifact(artifact_path) is None
+    artifact_path.write_bytes(b'ZEART001\x00')
+    assert load_artifact(artifact_path) is None
+
+    artifact_path.unlink()
+    with pytest.raises(ValueError, match='unmarshallable'):
+        save_artifact(artifact_path, ['a.yaml'], {'a.yaml': ((1, 2, 3), {'when': datetime.date(2020, 1, 1)})})
+    assert list(tmp_path.iterdir()) == []
@@ -0,0 +1,64 @@
+from datetime import timedelta
+
+import pytest
+
+from ze.src.converters import to_bool, to_duration, to_float, to_int, to_list
+
+
+def test_to_int():
+    """Tests int conversion of numbers and numeric strings."""
+    port = 8080
+    assert to_int(port) == port
+    assert to_int(f' {port} ') == port
+    assert to_int(float(port)) == port
+
+    for value in ('abc', None, True, False, 3.7, '3.7', float('nan'), float('inf')):
+        with pytest.raises(ValueError, match='is not a valid int'):
+            to_int(value)
+
+
+def test_to_float():
+    """Tests float conversion of numbers and numeric strings."""
+    ratio = 0.5
+    assert to_float(1) == 1.0
+    assert to_float(f' {ratio} ') == ratio
+
+    for value in ('abc', None, False):
+        with pytest.raises(ValueError, match='is not a valid float'):
+            to_float(value)
+
+
+def test_to_bool():
+    """Tests bool conversion of booleans, 0/1 and the usual strings."""
+    assert to_bool(True) is True
+    assert to_bool(0) is False
+    assert all(to_bool(value) is True for value in ('1', 'True', 'yes', 'ON', 'y', 't'))
+    assert all(to_bool(value) is False for value in ('0', 'false', 'No', 'off', 'n', 'f', ''))
+
+    for value in ('maybe', 2, None):
+        with pytest.raises(ValueError, match='is not a valid bool'):
+            to_bool(value)
+
+
+def test_to_list():
+    """Tests list conversion of sequences and separated strings."""
+    assert to_list(['a', 'b']) == ('a', 'b')
+    assert to_list('a, b,,c ') == ('a', 'b', 'c')
+    assert to_list('a:b', separator=':') == ('a', 'b')
+
+    with pytest.raises(ValueError, match='is not a valid list'):
+        to_list(42)
+
+
+def test_to_duration():
+    """Tests duration conversion of numbers and unit strings."""
+    assert to_duration(30) == timedelta(seconds=30)
+    assert to_duration('1.5') == timedelta(seconds=1.5)
+    assert to_duration('250ms') == timedelta(milliseconds=250)
+    assert to_duration('1h30m') == timedelta(hours=1, minutes=30)
+    assert to_duration('2d 12h') == timedelta(days=2, hours=12)
+    assert to_duration(timedelta(weeks=1)) == timedelta(weeks=1)
+
+    for value in ('soon', '5min', '10x', '', None, True, 'inf', '-inf', 'nan', float('inf'), float('nan'), '1e20'):
+        with pytest.raises(ValueError, match='is not a valid duration'):
+            to_duration(value)
@@ -1,7 +1,7 @@
 import pytest
 
 from ze.src.factory import ParserFactory
-from ze.src.models import ENVParser, JSONParser, TOMLParser, YAMLParser
+from ze.src.models import ConfigParser, ENVParser, JSONParser, ORJSONParser, TOMLParser, YAMLParser
 
 
 def test_get_parser_valid_extension():
@@ -25,3 +25,51 @@ def test_get_parser_valid_extension():
 def test_get_parser_invalid_extension():
     with pytest.raises(ValueError, match="Unsupported file extension: '.xml'."):
         ParserFactory.get_parser('config.xml')
+
+
+def test_get_parser_returns_singletons():
+    """Test that every lookup of a format returns the same parser instance."""
+    assert ParserFactory.get_parser('a.json') is ParserFactory.get_parser('b.json')
+    assert ParserFactory.get_parser('a.yml') is ParserFactory.get_parser('b.yaml')
+
+
+def test_get_parser_dotenv_variants():
+    """Test that dotfiles named after their format use that format's parser."""
+    assert isinstance(ParserFactory.get_parser('.env'), ENVParser)
+    assert isinstance(ParserFactory.get_parser('.env.local'), ENVParser)
+    assert ParserFactory.supports('.env.production')
+    assert not ParserFactory.supports('.envrc')
+    assert not ParserFactory.supports('README.md')
+
+
+def test_register_parser():
+    """Test registering, replacing and removing parsers through the public API."""
+
+    class INIParser(ConfigParser):
+        @classmethod
+        def parse(cls, file_path: str) -> dict:
+            return {}
+
+    ParserFactory.register(('.ini', '.cfg'), INIParser)
+    try:
+        assert isinstance(ParserFactory.get_parser('setup.cfg'), INIParser)
+        assert ParserFactory.get_parser('app.ini') is ParserFactory.get_parser('setup.cfg')
+    finally:
+        ParserFactory.unregister('.ini')
+        ParserFactory.unregister('.cfg')
+
+    assert not ParserFactory.supports('app.ini')
+    with pytest.raises(TypeError, match='Parser must be a ConfigParser, got dict.'):
+        ParserFactory.register('.ini', {})
+
+
+def test_register_fast_json_backend(json_file):
+    """Test plugging orjson in for JSON files when it is installed."""
+    pytest.importorskip('orjson')
+    file_path, expected_data = json_file
+
+    ParserFactory.register('.json', ORJSONParser)
+    try:
+        assert ParserFactory.get_parser(file_path).parse(file_path) == expected_data
+    finally:
+        ParserFactory.register('.json', JSONParser)
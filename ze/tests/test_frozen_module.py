@@ -0,0 +1,42 @@
+import copy
+import json
+import pickle
+
+import pytest
+
+from ze.src.frozen import FrozenDict, freeze
+
+
+def test_freeze_builds_compact_read_only_copy():
+    """
+    Tests that freeze converts sections and lists, and shares equal scalars.
+    """
+    data = {'a': {'url': 'postgres://' + 'x' * 3, 'ports': [1, 2]}, 'b': {'url': 'postgres://' + 'xxx'}, 'c': True}
+
+    frozen = freeze(data)
+
+    assert frozen == {'a': {'url': 'postgres://xxx', 'ports': (1, 2)}, 'b': {'url': 'postgres://xxx'}, 'c': True}
+    assert isinstance(frozen['a'], FrozenDict)
+    assert frozen['a']['url'] is frozen['b']['url']
+    assert freeze(frozen) is frozen
+    assert freeze({'x': 1, 'y': 1.0, 'z': True}) == {'x': 1, 'y': 1.0, 'z': True}
+    assert type(freeze({'y': 1.0, 'x': 1})['x']) is int
+
+
+def test_frozen_dict_is_read_only():
+    """
+    Tests that FrozenDict rejects writes but still serializes and pickles.
+    """
+    frozen = freeze({'a': {'b': [1]}})
+
+    with pytest.raises(TypeError):
+        frozen['a'] = 1
+    with pytest.raises(TypeError):
+        frozen['a'].update(b=2)
+    with pytest.raises(TypeError):
+        del frozen['a']
+
+    assert json.loads(json.dumps(frozen)) == {'a': {'b': [1]}}
+    assert pickle.loads(pickle.dumps(frozen)) == frozen
+    assert type(pickle.loads(pickle.dumps(frozen))['a']) is FrozenDict
+    assert copy.deepcopy(frozen) is frozen
@@ -0,0 +1,51 @@
+import subprocess
+import sys
+from pathlib import Path
+
+PROJECT_DIR = Path(__file__).resolve().parents[1]
+
+HEAVY_MODULES = (
+    'yaml',
+    'tomllib',
+    'tomli',
+    'json',
+    'concurrent.futures',
+    'multiprocessing',
+    'logging',
+    'pickle',
+    'asyncio',
+)
+
+
+def test_import_does_not_load_backends():
+    """
+    Tests that importing the package does not import any parsing backend or
+    other heavy module before it is needed.
+    """
+    code = f'import sys, ze; print(",".join(m for m in {HEAVY_MODULES!r} if m in sys.modules))'
+    result = subprocess.run(
+        [sys.executable, '-c', code], capture_output=True, text=True, check=True, cwd=PROJECT_DIR
+    )
+    assert not result.stdout.strip()
+
+
+def test_config_imports_yaml_on_first_yaml_parse(tmp_path):
+    """
+    Tests that the YAML backend is imported when a YAML file is first parsed.
+
+    Args:
+        tmp_path: Temporary directory provided by pytest.
+    """
+    (tmp_path / 'config.yaml').write_text('DATABASE_URL: sqlite:///dev.db\n', encoding='utf-8')
+    code = (
+        'import sys\n'
+        'from ze import config\n'
+        'from ze.src.settings import settings\n'
+        f'settings.BASE_DIR = settings.CONF_DIR = {str(tmp_path)!r}\n'
+        'assert "yaml" not in sys.modules\n'
+        'print(config("DATABASE_URL"), "yaml" in sys.modules)\n'
+    )
+    result = subprocess.run(
+        [sys.executable, '-c', code], capture_output=True, text=True, check=True, cwd=PROJECT_DIR
+    )
+    assert result.stdout.strip() == 'sqlite:///dev.db True'
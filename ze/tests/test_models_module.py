@@ -1,4 +1,10 @@
-from ze.src.models import ENVParser, JSONParser, TOMLParser, YAMLParser
+import json
+
+import pytest
+import yaml
+from dotenv import dotenv_values
+
+from ze.src.models import ENVParser, JSONParser, RTOMLParser, TOMLParser, YAMLParser
 
 
 def test_model_json_parser(json_file):
@@ -37,6 +43,24 @@ def test_yaml_parser(yaml_file):
     assert YAMLParser.parse(file_path) == expected_conf
 
 
+def test_yaml_parser_loader(yaml_file, monkeypatch):
+    """
+    Tests that YAMLParser prefers the libyaml loader and can be forced to
+    use the pure-Python one with the same result.
+
+    Args:
+        yaml_file (tuple): A tuple containing the file path of the YAML file
+         and the expected configuration after parsing.
+        monkeypatch: Pytest fixture for patching attributes.
+    """
+    file_path, expected_conf = yaml_file
+    assert YAMLParser.loader() is getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+    monkeypatch.setattr(YAMLParser, 'pure_python', True)
+    assert YAMLParser.loader() is yaml.SafeLoader
+    assert YAMLParser.parse(file_path) == expected_conf
+
+
 def test_env_parser(env_file):
     """
     Tests the ENVParser's ability to correctly parse an environment file
@@ -48,3 +72,176 @@ def test_env_parser(env_file):
     """
     file_path, excepted_conf = env_file
     assert ENVParser.parse(file_path) == excepted_conf
+
+
+ENV_CONTENT = """# generated by the secrets tooling
+export API_KEY=abc123
+HOST = db.local  # primary database
+GREETING="hello\\nworld \\"quoted\\""
+PATTERN='literal # not a comment \\n'
+FRAGMENT=a#b
+CERT="-----BEGIN-----
+line
+-----END-----"
+not an assignment
+EMPTY=
+DOTTED.KEY-NAME=value
+"""
+
+
+def test_env_parser_syntax(tmp_path):
+    """
+    Tests the ENVParser's handling of export prefixes, quoting, inline comments,
+    multi-line values and malformed lines.
+
+    Args:
+        tmp_path: Temporary directory provided by pytest.
+    """
+    file_path = tmp_path / '.env'
+    file_path.write_text(ENV_CONTENT, encoding='utf-8')
+
+    assert ENVParser.parse(file_path) == {
+        'API_KEY': 'abc123',
+        'HOST': 'db.local',
+        'GREETING': 'hello\nworld "quoted"',
+        'PATTERN': 'literal # not a comment \\n',
+        'FRAGMENT': 'a#b',
+        'CERT': '-----BEGIN-----\nline\n-----END-----',
+        'EMPTY': '',
+        'DOTTED.KEY-NAME': 'value',
+    }
+
+
+def test_env_parser_matches_python_dotenv(tmp_path):
+    """
+    Tests that the ENVParser agrees with python-dotenv when interpolation is disabled.
+
+    Args:
+        tmp_path: Temporary directory provided by pytest.
+    """
+    file_path = tmp_path / '.env'
+    file_path.write_text(ENV_CONTENT.replace('not an assignment\n', ''), encoding='utf-8')
+
+    assert ENVParser.parse(file_path) == dotenv_values(file_path, interpolate=False)
+
+
+def test_parser_keys_scan(tmp_path):
+    """
+    Tests the cheap top-level key scans and their fallback to None for syntax
+    they do not handle.
+
+    Args:
+        tmp_path: Temporary directory provided by pytest.
+    """
+    block_yaml = tmp_path / 'block.yaml'
+    block_yaml.write_text('---\nDATABASE:\n  url: postgres://db\n# comment\nMOTD: |\n  hello\nDEBUG: true\n')
+    flow_yaml = tmp_path / 'flow.yaml'
+    flow_yaml.write_text('{"DATABASE_URL": "postgres://db"}')
+    bool_yaml = tmp_path / 'bool.yaml'
+    bool_yaml.write_text('on: 1\n')
+    toml = tmp_path / 'config.toml'
+    toml.write_text('name = "app"\n  server.port = 80\n[database]\nurl = "x"\n[[workers]]\n[database.replica]\n')
+    multiline_toml = tmp_path / 'multiline.toml'
+    multiline_toml.write_text('hosts = [\n  "a",\n]\nname = "app"\n')
+
+    assert YAMLParser.keys(block_yaml) == set(YAMLParser.parse(block_yaml)) == {'DATABASE', 'MOTD', 'DEBUG'}
+    assert YAMLParser.keys(flow_yaml) is None
+    assert YAMLParser.keys(bool_yaml) is None
+    assert TOMLParser.keys(toml) == set(TOMLParser.parse(toml)) == {'name', 'server', 'database', 'workers'}
+    assert TOMLParser.keys(multiline_toml) is None
+    assert JSONParser.keys(tmp_path / 'unused.json') is None
+    assert ENVParser.keys(tmp_path / 'unused.env') is None
+
+
+@pytest.mark.parametrize('chunk_size', [1, 7, 1024])
+def test_json_parser_streaming(tmp_path, monkeypatch, chunk_size):
+    """
+    Tests that streamed JSON parsing matches json.load, whatever the chunk
+    boundaries, and falls back to it for documents it does not stream.
+
+    Args:
+        tmp_path: Temporary directory provided by pytest.
+        monkeypatch: Pytest fixture for patching attributes.
+        chunk_size: Number of characters read at once.
+    """
+    monkeypatch.setattr(JSONParser, 'stream_threshold', 0)
+    monkeypatch.setattr(JSONParser, 'chunk_size', chunk_size)
+    data = {f'flag_{index}': {'on': index % 2 == 0, 'ratio': index / 3, 'routes': ['/a', None]} for index in range(50)}
+    data['big'] = 12345678901234567890
+    file_path = tmp_path / 'config.json'
+
+    for text in (json.dumps(data, indent=2), ' { } ', '{"a": 1, "a": {"b": 1.5e3}}'):
+        file_path.write_text(text, encoding='utf-8')
+        assert JSONParser.parse(file_path) == json.loads(text)
+
+    file_path.write_text('[1, 2]', encoding='utf-8')
+    assert JSONParser.parse(file_path) == [1, 2]
+    for text in ('{"a": 1,}', '{"a": 1} {}', '{"a" 1}'):
+        file_path.write_text(text, encoding='utf-8')
+        with pytest.raises(json.JSONDecodeError):
+            JSONParser.parse(file_path)
+
+
+def test_json_parser_streams_only_from_threshold(tmp_path, monkeypatch):
+    """
+    Tests that files below the stream threshold keep the whole-document path.
+
+    Args:
+        tmp_path: Temporary directory provided by pytest.
+        monkeypatch: Pytest fixture for patching attributes.
+    """
+    file_path = tmp_path / 'config.json'
+    file_path.write_text('{"a": 1}', encoding='utf-8')
+    monkeypatch.setattr(JSONParser, '_members', lambda file: pytest.fail('a small file was streamed'))
+    assert JSONParser.parse(file_path) == {'a': 1}
+
+    monkeypatch.setattr(JSONParser, 'stream_threshold', file_path.stat().st_size)
+    with pytest.raises(pytest.fail.Exception, match='a small file was streamed'):
+        JSONParser.parse(file_path)
+
+
+@pytest.mark.parametrize('pure_python', [False, True])
+def test_yaml_parser_streaming(tmp_path, monkeypatch, pure_python):
+    """
+    Tests that streamed YAML parsing matches yaml.load, aliases included, and
+    falls back to it for documents it does not stream.
+
+    Args:
+        tmp_path: Temporary directory provided by pytest.
+        monkeypatch: Pytest fixture for patching attributes.
+        pure_python: Whether the pure-Python loader is used.
+    """
+    monkeypatch.setattr(YAMLParser, 'stream_threshold', 0)
+    monkeypatch.setattr(YAMLParser, 'pure_python', pure_python)
+    file_path = tmp_path / 'config.yaml'
+    texts = (
+        'base: &base {pool: 5}\ndb:\n  <<: *base\n  url: x\nhosts: &hosts [a, b]\nmirror: *hosts\nwhen: 2001-12-14\n',
+        '<<: {a: 1}\nb: 2\n',
+        '- 1\n',
+        '',
+        '!!map {a: 1}\n',
+    )
+
+    for text in texts:
+        file_path.write_text(text, encoding='utf-8')
+        assert YAMLParser.parse(file_path) == yaml.safe_load(text)
+
+    file_path.write_text(texts[0], encoding='utf-8')
+    parsed = YAMLParser.parse(file_path)
+    assert parsed['mirror'] is parsed['hosts']
+    file_path.write_text('a: 1\n---\nb: 2\n', encoding='utf-8')
+    with pytest.raises(yaml.YAMLError):
+        YAMLParser.parse(file_path)
+
+
+def test_rtoml_parser(toml_file):
+    """
+    Tests the optional rtoml backend against the same fixture as TOMLParser.
+
+    Args:
+        toml_file (tuple): A tuple containing the file path of the TOML file
+        and the expected data after parsing.
+    """
+    pytest.importorskip('rtoml')
+    file_path, expected_data = toml_file
+    assert RTOMLParser.parse(file_path) == expected_data
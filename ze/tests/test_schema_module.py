@@ -0,0 +1,93 @@
+from dataclasses import dataclass, field
+from datetime import timedelta
+from typing import List, Optional
+
+import pytest
+
+from ze.src.schema import Field, Schema, compile_schema
+
+
+def test_dict_schema_fills_defaults_and_converts():
+    """
+    Tests that a dict schema fills in defaults, converts strings and shares
+    the sections it leaves unchanged.
+    """
+    schema = Schema(
+        {
+            'PORT': int,
+            'DEBUG': Field(bool, False),
+            'TIMEOUT': Field(timedelta, timedelta(seconds=5)),
+            'cache': {'url': str},
+            'database': {'url': str, 'pool': Field(int, 5), 'replica': Optional[str]},
+        }
+    )
+    data = {
+        'PORT': '8080',
+        'cache': {'url': 'redis://'},
+        'database': {'url': 'postgres://', 'replica': None},
+        'EXTRA': 1,
+    }
+
+    validated = schema.validate(data)
+
+    assert validated == {
+        'PORT': 8080,
+        'DEBUG': False,
+        'TIMEOUT': timedelta(seconds=5),
+        'cache': {'url': 'redis://'},
+        'database': {'url': 'postgres://', 'replica': None, 'pool': 5},
+        'EXTRA': 1,
+    }
+    assert validated['cache'] is data['cache']
+    assert data['PORT'] == '8080'
+    assert schema.keys == {'PORT', 'DEBUG', 'TIMEOUT', 'cache', 'database'}
+    assert compile_schema(schema) is schema
+    assert compile_schema(None) is None
+
+
+def test_schema_lists_every_error():
+    """
+    Tests that validation reports every missing key and invalid value at once.
+    """
+    schema = Schema({'PORT': int, 'RATIO': float, 'HOSTS': List[str], 'database': {'url': str, 'pool': int}})
+
+    with pytest.raises(ValueError, match='^Invalid configuration:') as error:
+        schema.validate({'PORT': True, 'RATIO': 1, 'HOSTS': ['a'], 'database': {'pool': 'x'}})
+
+    message = str(error.value)
+    assert 'PORT: expected int, got bool True' in message
+    assert 'database.url: missing required key' in message
+    assert 'database.pool:' in message
+    assert 'RATIO' not in message
+    assert 'HOSTS' not in message
+    with pytest.raises(ValueError, match='database: expected a section'):
+        schema.validate({'PORT': 1, 'RATIO': 1.0, 'HOSTS': [], 'database': 'postgres://'})
+    with pytest.raises(TypeError):
+        Schema([int])
+
+
+def test_dataclass_schema():
+    """
+    Tests that dataclass fields, nested dataclasses and default factories declare the schema.
+    """
+
+    @dataclass
+    class Database:
+        url: str
+        pool: int = 5
+
+    @dataclass
+    class Config:
+        database: Database
+        PORT: int = 8000
+        HOSTS: List[str] = field(default_factory=list)
+
+    schema = Schema(Config)
+
+    assert schema.validate({'database': {'url': 'postgres://'}}) == {
+        'database': {'url': 'postgres://', 'pool': 5},
+        'PORT': 8000,
+        'HOSTS': [],
+    }
+    with pytest.raises(ValueError, match='database.url: missing required key'):
+        schema.validate({})
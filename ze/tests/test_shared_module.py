@@ -0,0 +1,82 @@
+import os
+import time
+
+import pytest
+
+from ze.src import shared
+from ze.src.shared import attach_shared, publish_shared, read_generation
+
+
+def test_publish_and_attach_shared(tmp_path):
+    """
+    Tests that every publication bumps the generation and that readers map the
+    latest one.
+
+    Args:
+        tmp_path: Temporary directory provided by pytest.
+    """
+    share_path = tmp_path / 'config.shared'
+    assert read_generation(share_path) is None
+    assert attach_shared(share_path) is None
+
+    first = publish_shared(share_path, {'PORT': 80})
+    assert first == 1
+    generation = publish_shared(share_path, {'PORT': 443})
+    assert generation == first + 1
+    assert read_generation(share_path) == generation
+    assert attach_shared(share_path) == (generation, {'PORT': 443})
+    assert list(tmp_path.iterdir()) == [share_path]
+
+
+def test_attach_shared_rejects_foreign_file(tmp_path):
+    """
+    Tests that a file that was not published by publish_shared is ignored.
+
+    Args:
+        tmp_path: Temporary directory provided by pytest.
+    """
+    share_path = tmp_path / 'config.shared'
+    share_path.write_bytes(b'not a shared configuration')
+    assert read_generation(share_path) is None
+    assert attach_shared(share_path) is None
+
+    share_path.write_bytes(b'')
+    assert attach_shared(share_path) is None
+    assert publish_shared(share_path, {}) == 1
+
+
+def test_stale_shared_file_is_ignored(tmp_path, monkeypatch):
+    """
+    Tests that a file published before this run started, or by a process that
+    is gone, is neither read nor counted as a previous generation.
+
+    Args:
+        tmp_path: Temporary directory provided by pytest.
+        monkeypatch: Pytest fixture for patching attributes.
+    """
+    share_path = tmp_path / 'config.shared'
+    publish_shared(share_path, {'PORT': 80})
+    monkeypatch.setattr(shared, '_RUN_START', time.time_ns() + 1)
+    assert read_generation(share_path) is None
+    assert attach_shared(share_path) is None
+    assert publish_shared(share_path, {'PORT': 443}) == 1
+    assert attach_shared(share_path) == (1, {'PORT': 443})
+
+
+@pytest.mark.skipif(not hasattr(os, 'fork'), reason='requires fork')
+def test_shared_file_of_dead_master_is_ignored(tmp_path):
+    """
+    Tests that a file whose publishing process exited is ignored.
+
+    Args:
+        tmp_path: Temporary directory provided by pytest.
+    """
+    share_path = tmp_path / 'config.shared'
+    pid = os.fork()
+    if pid == 0:
+        os._exit(0)
+    os.waitpid(pid, 0)
+    share_path.write_bytes(shared._HEADER.pack(shared._MAGIC, 1, pid, time.time_ns()))
+
+    assert read_generation(share_path) is None
+    assert attach_shared(share_path) is None
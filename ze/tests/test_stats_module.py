@@ -0,0 +1,40 @@
+from ze.src.stats import CountingIndex, FileStats, LoadStats
+
+
+def test_load_stats_reports_slowest_files():
+    """
+    Tests that the slowest files are ranked by read and parse time and that the
+    statistics export as plain data.
+    """
+    stats = LoadStats()
+    stats.files = {
+        'a.json': FileStats('a.json', 10, 1, 0.001, 0.001),
+        'b.yaml': FileStats('b.yaml', 20, 2, 0.001, 0.05),
+        'c.toml': FileStats('c.toml', 30, 3, 0.02, 0.001),
+    }
+
+    assert [file_stats.file for file_stats in stats.slowest(2)] == ['b.yaml', 'c.toml']
+    exported = stats.as_dict()
+    assert exported['files']['a.json'] == {
+        'file': 'a.json',
+        'size': 10,
+        'keys': 1,
+        'read_seconds': 0.001,
+        'parse_seconds': 0.001,
+    }
+    assert exported['hits'] == exported['misses'] == 0
+
+
+def test_counting_index_counts_lookups():
+    """
+    Tests that lookups through get are counted as hits and misses.
+    """
+    stats = LoadStats()
+    port = 80
+    index = CountingIndex({'PORT': port}, stats)
+
+    assert index.get('PORT') == port
+    assert index.get('HOST', 'localhost') == 'localhost'
+    assert index.get('HOST') is None
+    assert (stats.hits, stats.misses) == (1, 2)
+    assert index == {'PORT': port}
@@ -0,0 +1,17 @@
+import pytest
+
+from ze.src.timing import best_of
+
+
+def test_best_of_times_every_call():
+    """Tests that best_of calls the function `repeat` times and returns the shortest call."""
+    calls = []
+    repeat = 3
+    seconds = best_of(lambda: calls.append(None), repeat)
+
+    assert len(calls) == repeat
+    assert seconds >= 0
+
+    for repeat in (0, -1):
+        with pytest.raises(ValueError, match='repeat must be at least 1'):
+            best_of(lambda: None, repeat)
@@ -0,0 +1,74 @@
+import os
+import sys
+
+import pytest
+
+from ze.src.watcher import InotifyWatcher, PollingWatcher
+
+
+@pytest.mark.parametrize(
+    'watcher_class',
+    [
+        PollingWatcher,
+        pytest.param(
+            InotifyWatcher, marks=pytest.mark.skipif(not sys.platform.startswith('linux'), reason='requires inotify')
+        ),
+    ],
+)
+def test_watcher_reports_changed_files(tmp_path, watcher_class):
+    """
+    Tests that watchers report modified, added and removed configuration files only.
+
+    Args:
+        tmp_path: Temporary directory provided by pytest.
+        watcher_class: Watcher implementation under test.
+    """
+    (tmp_path / 'config.json').write_text('{"KEY": 1}', encoding='utf-8')
+    (tmp_path / 'old.yaml').write_text('KEY: 1', encoding='utf-8')
+    watcher = watcher_class(tmp_path, interval=0.05)
+
+    try:
+        assert watcher.changes() == set()
+
+        (tmp_path / 'config.json').write_text('{"KEY": 22}', encoding='utf-8')
+        (tmp_path / 'new.toml').write_text('KEY = 1', encoding='utf-8')
+        (tmp_path / 'notes.txt').write_text('ignored', encoding='utf-8')
+        os.remove(tmp_path / 'old.yaml')
+
+        assert watcher.changes() == {'config.json', 'new.toml', 'old.yaml'}
+    finally:
+        watcher.close()
+
+
+@pytest.mark.parametrize(
+    'watcher_class',
+    [
+        PollingWatcher,
+        pytest.param(
+            InotifyWatcher, marks=pytest.mark.skipif(not sys.platform.startswith('linux'), reason='requires inotify')
+        ),
+    ],
+)
+def test_watcher_follows_symlink_swap(tmp_path, watcher_class):
+    """
+    Tests that watchers report a file whose `..data` symlink is swapped the way Kubernetes updates a ConfigMap.
+
+    Args:
+        tmp_path: Temporary directory provided by pytest.
+        watcher_class: Watcher implementation under test.
+    """
+    (tmp_path / '..2024_a').mkdir()
+    (tmp_path / '..2024_a' / 'app.json').write_text('{"KEY": 1}', encoding='utf-8')
+    os.symlink('..2024_a', tmp_path / '..data')
+    os.symlink(os.path.join('..data', 'app.json'), tmp_path / 'app.json')
+    watcher = watcher_class(tmp_path, interval=0.05)
+
+    try:
+        (tmp_path / '..2024_b').mkdir()
+        (tmp_path / '..2024_b' / 'app.json').write_text('{"KEY": 2}', encoding='utf-8')
+        os.symlink('..2024_b', tmp_path / '..data_tmp')
+        os.replace(tmp_path / '..data_tmp', tmp_path / '..data')
+
+        assert watcher.changes() == {'app.json'}
+    finally:
+        watcher.close()
@@ -1,3 +1,4 @@
-from ze.src.main import config
+from ze.src.main import config, manager
+from ze.src.manager import ConfigManager
 
-__all__ = ["config"]
+__all__ = ["ConfigManager", "config", "manager"]
@@ -0,0 +1,59 @@
+import marshal
+import os
+from typing import AnyStr, Dict, List, Optional, Tuple
+
+ARTIFACT_MAGIC = b'ZEART001'
+
+
+def save_artifact(artifact_path: AnyStr, config_files: List, layers: Dict):
+    """Write the discovered files and parsed layers to a precompiled artifact.
+
+    Args:
+        artifact_path (AnyStr): Path of the artifact file.
+        config_files (List): Discovered configuration filenames, in merge order.
+        layers (Dict): Per-file layers, mapping each filename to its stat
+        fingerprint and parsed data.
+
+    Raises:
+        ValueError: If the data holds values marshal cannot encode, such as the
+        dates of YAML or TOML files, or frozen sections.
+
+    Note:
+        The artifact is marshal-encoded, which only supports the builtin types
+        but loads faster than any parser or pickle. It is written to a temporary
+        file and renamed into place.
+    """
+    payload = ARTIFACT_MAGIC + marshal.dumps((list(config_files), layers))
+    tmp_path = f'{os.fspath(artifact_path)}.{os.getpid()}.tmp'
+    try:
+        with open(tmp_path, 'wb') as file:
+            file.write(payload)
+        os.replace(tmp_path, artifact_path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def load_artifact(artifact_path: AnyStr) -> Optional[Tuple[List, Dict]]:
+    """Load the files and layers stored in a precompiled artifact.
+
+    Args:
+        artifact_path (AnyStr): Path of the artifact file.
+
+    Returns:
+        Optional[Tuple[List, Dict]]: The configuration filenames and their
+        layers, or None when the artifact is missing or invalid.
+    """
+    try:
+        with open(artifact_path, 'rb') as file:
+            payload = file.read()
+    except OSError:
+        return None
+    if not payload.startswith(ARTIFACT_MAGIC):
+        return None
+    try:
+        config_files, layers = marshal.loads(memoryview(payload)[len(ARTIFACT_MAGIC):])
+    except (EOFError, ValueError, TypeError):
+        return None
+    return config_files, layers
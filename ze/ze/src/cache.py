@@ -0,0 +1,78 @@
+import hashlib
+import os
+import pickle
+from typing import AnyStr, Dict, List, Optional, Tuple
+
+SNAPSHOT_VERSION = 2
+
+Fingerprint = Tuple[str, int, int, str]
+
+
+def file_fingerprint(file_path: AnyStr, previous: Optional[Fingerprint] = None) -> Fingerprint:
+    """Build the fingerprint used to validate a snapshot entry.
+
+    Args:
+        file_path (AnyStr): Path of the configuration file.
+        previous (Optional[Fingerprint]): Fingerprint built earlier for the same
+        file, whose content hash is reused when its mtime and size still match.
+
+    Returns:
+        Fingerprint: Tuple of (path, mtime in nanoseconds, size, content hash).
+    """
+    stat = os.stat(file_path)
+    if previous is not None and previous[1:3] == (stat.st_mtime_ns, stat.st_size):
+        return previous
+    with open(file_path, 'rb') as file:
+        digest = hashlib.file_digest(file, 'blake2b').hexdigest()
+    return os.fspath(file_path), stat.st_mtime_ns, stat.st_size, digest
+
+
+def load_snapshot(cache_path: AnyStr, fingerprints: List[Fingerprint]) -> Optional[Dict]:
+    """Load the configuration data stored in a snapshot file.
+
+    Args:
+        cache_path (AnyStr): Path of the snapshot file.
+        fingerprints (List[Fingerprint]): Fingerprints of the current source files,
+        in load order.
+
+    Returns:
+        Optional[Dict]: The cached data, or None when the snapshot
+        is missing, unreadable or was built from different source files.
+
+    Note:
+        Snapshots are pickled, so the cache file must live somewhere only the
+        application itself can write to.
+    """
+    try:
+        with open(cache_path, 'rb') as file:
+            version, cached_fingerprints, data = pickle.load(file)
+    except (OSError, EOFError, ValueError, TypeError, pickle.UnpicklingError):
+        return None
+
+    if version != SNAPSHOT_VERSION or cached_fingerprints != fingerprints:
+        return None
+    return data
+
+
+def save_snapshot(cache_path: AnyStr, fingerprints: List[Fingerprint], data: Dict):
+    """Write configuration data to a snapshot file.
+
+    Args:
+        cache_path (AnyStr): Path of the snapshot file.
+        fingerprints (List[Fingerprint]): Fingerprints of the source files the
+        data was built from.
+        data (Dict): Configuration data to store, such as the per-file layers.
+
+    Note:
+        The snapshot is written to a temporary file and renamed into place, so
+        concurrent readers never see a partial file. Write errors are ignored,
+        the snapshot is only an optimization.
+    """
+    tmp_path = f'{os.fspath(cache_path)}.{os.getpid()}.tmp'
+    try:
+        with open(tmp_path, 'wb') as file:
+            pickle.dump((SNAPSHOT_VERSION, fingerprints, data), file, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, cache_path)
+    except (OSError, pickle.PicklingError):
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
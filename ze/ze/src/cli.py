@@ -0,0 +1,104 @@
+import argparse
+import contextlib
+import os
+import sys
+from typing import Iterator, List, Optional
+
+from .artifact import load_artifact, save_artifact
+from .core import clear_parse_cache
+from .manager import ConfigManager
+from .settings import settings
+from .timing import best_of
+
+
+@contextlib.contextmanager
+def _settings(**values) -> Iterator[None]:
+    """Override settings for the duration of a command."""
+    previous = {name: getattr(settings, name) for name in values}
+    for name, value in values.items():
+        setattr(settings, name, value)
+    try:
+        yield
+    finally:
+        for name, value in previous.items():
+            setattr(settings, name, value)
+
+
+def _positive_int(text: str) -> int:
+    """Parse a command line integer that must be at least 1."""
+    value = int(text)
+    if value < 1:
+        raise argparse.ArgumentTypeError(f'must be at least 1, got {value}')
+    return value
+
+
+def _load(root: Optional[str]):
+    """Load a configuration directory with a fresh manager."""
+    ConfigManager(root)._load_config_files()
+
+
+def _compile(args: argparse.Namespace) -> int:
+    """Compile a configuration directory into an artifact and compare load times."""
+    # Every file is parsed and the layers are kept as plain data, whatever the
+    # settings of the application: that is what the artifact must hold.
+    with _settings(LAZY_LOAD=False, FREEZE=False, CACHE_FILE=None, SHARED_FILE=None, ARTIFACT=None, STATS=False):
+        manager = ConfigManager(args.root)
+        path = manager._config_dir()
+        if path is None:
+            print(f'error: configuration directory not found: {args.root or settings.CONF_DIR}', file=sys.stderr)
+            return 1
+        manager._load_config_files()
+        try:
+            save_artifact(args.output, manager._config_files, manager._layers)
+        except ValueError as error:
+            print(f'error: cannot compile {path}: {error}', file=sys.stderr)
+            return 1
+
+        def parse():
+            clear_parse_cache()
+            _load(args.root)
+
+        parse_seconds = best_of(parse, args.repeat)
+        read_seconds = best_of(lambda: load_artifact(args.output), args.repeat)
+        with _settings(ARTIFACT=args.output):
+            artifact_seconds = best_of(lambda: _load(args.root), args.repeat)
+
+    size = os.path.getsize(args.output) / 1024
+    print(f'Compiled {len(manager._layers)} files from {path} into {args.output} ({size:.1f} KiB)')
+    print(f'  parse files:     {parse_seconds * 1000:9.3f} ms')
+    print(f'  load artifact:   {artifact_seconds * 1000:9.3f} ms  ({parse_seconds / artifact_seconds:.1f}x faster)')
+    print(f'    of which read: {read_seconds * 1000:9.3f} ms')
+    return 0
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Run the `python -m ze` command line.
+
+    Args:
+        argv (Optional[List[str]]): Arguments, without the program name
+        (default: sys.argv[1:]).
+
+    Returns:
+        int: Exit status.
+    """
+    parser = argparse.ArgumentParser(prog='python -m ze', description='ZeConfig command line.')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    compile_parser = commands.add_parser(
+        'compile',
+        help='precompile a configuration directory into an artifact',
+        description=(
+            'Discover, parse and merge a configuration directory like ConfigManager, and store its files and '
+            'layers into a marshal artifact. Point settings.ARTIFACT to it so the first load skips discovery '
+            'and parsing. Environment overrides and schemas still apply at load time.'
+        ),
+    )
+    compile_parser.add_argument('root', nargs='?', help='configuration directory (default: CONF_DIR or BASE_DIR)')
+    compile_parser.add_argument('-o', '--output', default='config.zeart', help='artifact path (default: %(default)s)')
+    compile_parser.add_argument(
+        '--repeat', type=_positive_int, default=5, help='timed loads per method (default: %(default)s)'
+    )
+    compile_parser.set_defaults(handler=_compile)
+
+    args = parser.parse_args(argv)
+    return args.handler(args)
@@ -0,0 +1,158 @@
+import math
+import re
+from datetime import timedelta
+from typing import Any, Tuple
+
+TRUE_VALUES = frozenset({'1', 'true', 't', 'yes', 'y', 'on'})
+FALSE_VALUES = frozenset({'0', 'false', 'f', 'no', 'n', 'off', ''})
+
+DURATION_UNITS = {
+    'ms': 0.001,
+    's': 1,
+    'm': 60,
+    'h': 3600,
+    'd': 86400,
+    'w': 604800,
+}
+_DURATION_PART = re.compile(r'\s*(\d+(?:\.\d+)?)\s*(ms|s|m|h|d|w)')
+
+
+def to_int(value: Any) -> int:
+    """Convert a configuration value to an int.
+
+    Args:
+        value (Any): Raw value, an int, an integral float such as 8080.0 or a
+        numeric string such as "8080".
+
+    Returns:
+        int: The converted value.
+
+    Raises:
+        ValueError: If the value is a bool, a float with a fractional part or
+        cannot be converted.
+    """
+    if isinstance(value, bool) or (isinstance(value, float) and not value.is_integer()):
+        raise ValueError(f'{value!r} is not a valid int')
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        raise ValueError(f'{value!r} is not a valid int') from None
+
+
+def to_float(value: Any) -> float:
+    """Convert a configuration value to a float.
+
+    Args:
+        value (Any): Raw value, a number or a numeric string such as "0.5".
+
+    Returns:
+        float: The converted value.
+
+    Raises:
+        ValueError: If the value is a bool or cannot be converted.
+    """
+    if isinstance(value, bool):
+        raise ValueError(f'{value!r} is not a valid float')
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        raise ValueError(f'{value!r} is not a valid float') from None
+
+
+def to_bool(value: Any) -> bool:
+    """Convert a configuration value to a bool.
+
+    Args:
+        value (Any): Raw value, a bool, 0/1 or one of the strings
+        true/false, yes/no, on/off, t/f, y/n, 1/0 (case insensitive).
+
+    Returns:
+        bool: The converted value.
+
+    Raises:
+        ValueError: If the value is not a recognised boolean.
+    """
+    if isinstance(value, bool):
+        return value
+    if isinstance(value, int) and value in {0, 1}:
+        return bool(value)
+    if isinstance(value, str):
+        lowered = value.strip().lower()
+        if lowered in TRUE_VALUES:
+            return True
+        if lowered in FALSE_VALUES:
+            return False
+    raise ValueError(f'{value!r} is not a valid bool')
+
+
+def to_list(value: Any, separator: str = ',') -> Tuple:
+    """Convert a configuration value to a sequence of items.
+
+    Args:
+        value (Any): Raw value, a list or tuple, or a string of items
+        separated by `separator`. Items are stripped and empty ones dropped.
+        separator (str): Item separator for string values (default: ',').
+
+    Returns:
+        Tuple: The items. A tuple is returned so that cached results cannot
+        be modified by callers.
+
+    Raises:
+        ValueError: If the value is neither a sequence nor a string.
+    """
+    if isinstance(value, (list, tuple)):
+        return tuple(value)
+    if isinstance(value, str):
+        return tuple(item for item in (part.strip() for part in value.split(separator)) if item)
+    raise ValueError(f'{value!r} is not a valid list')
+
+
+def _seconds(value: Any, seconds: float) -> timedelta:
+    """Build the timedelta of a number of seconds parsed from `value`.
+
+    Raises:
+        ValueError: If the number is infinite, NaN or out of timedelta range.
+    """
+    if not math.isfinite(seconds):
+        raise ValueError(f'{value!r} is not a valid duration')
+    try:
+        return timedelta(seconds=seconds)
+    except OverflowError:
+        raise ValueError(f'{value!r} is not a valid duration') from None
+
+
+def to_duration(value: Any) -> timedelta:
+    """Convert a configuration value to a duration.
+
+    Args:
+        value (Any): Raw value, a timedelta, a number of seconds or a string
+        of one or more <number><unit> parts such as "250ms", "30s", "1h30m".
+        Supported units are ms, s, m, h, d and w; a bare number means seconds.
+
+    Returns:
+        timedelta: The converted value.
+
+    Raises:
+        ValueError: If the value is not a valid duration.
+    """
+    if isinstance(value, timedelta):
+        return value
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return _seconds(value, value)
+    if isinstance(value, str):
+        text = value.strip()
+        try:
+            return _seconds(value, float(text))
+        except ValueError:
+            pass
+
+        seconds, position = 0.0, 0
+        for match in _DURATION_PART.finditer(text):
+            if match.start() != position:
+                break
+            seconds += float(match.group(1)) * DURATION_UNITS[match.group(2)]
+            position = match.end()
+        else:
+            if position and position == len(text):
+                return _seconds(value, seconds)
+    raise ValueError(f'{value!r} is not a valid duration')
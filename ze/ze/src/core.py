@@ -1,8 +1,88 @@
 import os
+import time
+from fnmatch import fnmatchcase
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AnyStr,
+    Callable,
+    Dict,
+    FrozenSet,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Set,
+    Tuple,
+)
 
 from .factory import ParserFactory
 
-from typing import List, AnyStr, Dict
+if TYPE_CHECKING:
+    from .stats import FileStats
+
+StatFingerprint = Tuple[int, int, int, int]
+Layer = Tuple[StatFingerprint, Dict]
+Pending = Tuple[StatFingerprint, FrozenSet[str]]
+Override = Tuple[Tuple[str, ...], str]
+Provenance = Dict[str, Tuple[str, ...]]
+
+_MISSING = object()
+
+# Strategies of `merge_layers` for two sections, and two lists, at the same path.
+DICT_STRATEGIES = ("replace", "merge")
+LIST_STRATEGIES = ("replace", "append", "unique")
+
+# Parsed layers shared by every manager of the process, keyed by stat
+# fingerprint and parser, so that symlinks to the same file share an entry too.
+# `_cache_keys` maps each absolute path to the key of its last parse, to drop
+# the entry of a file once it changed.
+_parse_cache: Dict[Tuple, Layer] = {}
+_cache_keys: Dict[str, Tuple] = {}
+
+# Scan plans of `discover_files`, keyed by root and options: the mtime of every
+# directory walked and the files found.
+_manifests: Dict[Tuple, Tuple[Dict[str, int], List[str]]] = {}
+
+
+# Executor class names in concurrent.futures, which is only imported when a
+# parallel load is requested: it pulls in multiprocessing and logging.
+EXECUTORS = {
+    "thread": "ThreadPoolExecutor",
+    "process": "ProcessPoolExecutor",
+}
+
+# A pool only pays for its start-up when there are files to spread over it.
+_MIN_PARALLEL_FILES = 2
+
+
+class ParseOptions(NamedTuple):
+    """How the layer functions parse the files they need.
+
+    Attributes:
+        workers (int): Size of the worker pool. 0 parses sequentially.
+        executor (str): "thread" or "process" pool for parallel parsing.
+        profile (Optional[Dict[str, FileStats]]): Receives the statistics of
+        the parsed files, see `parse_many`.
+    """
+
+    workers: int = 0
+    executor: str = "thread"
+    profile: Optional[Dict[str, "FileStats"]] = None
+
+
+def parse_file(file_path: AnyStr) -> Dict:
+    """Parse a single configuration file.
+
+    Args:
+        file_path (AnyStr): Path of the configuration file.
+
+    Returns:
+        Dict: Parsed configuration data.
+    """
+    return ParserFactory.get_parser(file_path).parse(file_path)
 
 
 def parse_data(
@@ -25,16 +105,832 @@ def parse_data(
     file_path = os.path.join(
         path, file
     )
-    parser = ParserFactory.get_parser(file)
     config_data.update(
-        parser.parse(file_path)
+        parse_file(file_path)
     )
 
 
+def profile_file(file_path: AnyStr) -> Tuple[Dict, "FileStats"]:
+    """Parse a configuration file and measure it.
+
+    Args:
+        file_path (AnyStr): Path to the configuration file.
+
+    Returns:
+        Tuple[Dict, FileStats]: The parsed data and the file statistics.
+
+    Note:
+        The file is read once on its own to time the I/O, through a fixed
+        buffer so that it is never held in memory twice; the parser then reads
+        it again from the page cache. The size comes from the open file's stat.
+    """
+    from .stats import FileStats
+
+    start = time.perf_counter()
+    with open(file_path, "rb", buffering=0) as file:
+        size = os.fstat(file.fileno()).st_size
+        buffer = bytearray(64 * 1024)
+        while file.readinto(buffer):
+            pass
+    read = time.perf_counter()
+    data = parse_file(file_path)
+    parsed = time.perf_counter()
+    return data, FileStats(os.fspath(file_path), size, _count_keys(data), read - start, parsed - read)
+
+
+def _count_keys(data: Dict) -> int:
+    """Count the keys of parsed data, those of nested sections included."""
+    count = 0
+    stack = [data]
+    while stack:
+        section = stack.pop()
+        count += len(section)
+        stack.extend(value for value in section.values() if isinstance(value, dict))
+    return count
+
+
+def parse_many(
+    file_paths: List,
+    workers: int = 0,
+    executor: str = "thread",
+    profile: Optional[Dict[str, "FileStats"]] = None,
+) -> Iterator[Dict]:
+    """Parse several configuration files, optionally on a worker pool.
+
+    Args:
+        file_paths (List): Paths of the configuration files.
+        workers (int): Size of the worker pool. 0 parses sequentially.
+        executor (str): "thread" or "process" pool for parallel parsing.
+        profile (Optional[Dict[str, FileStats]]): When given, every file is
+        measured and its statistics stored there, keyed by path.
+
+    Returns:
+        Iterator[Dict]: Parsed data of each file, in the order of `file_paths`
+        whatever the order in which the workers finish.
+
+    Raises:
+        ValueError: If the executor name is not supported.
+    """
+    if profile is None:
+        yield from _map(parse_file, file_paths, workers, executor)
+        return
+    for data, file_stats in _map(profile_file, file_paths, workers, executor):
+        profile[file_stats.file] = file_stats
+        yield data
+
+
+def _map(function: Callable, file_paths: List, workers: int, executor: str) -> Iterator:
+    """Apply a function to every file path, on a worker pool if requested."""
+    if not workers or len(file_paths) < _MIN_PARALLEL_FILES:
+        yield from map(function, file_paths)
+        return
+
+    pool_name = EXECUTORS.get(executor)
+    if not pool_name:
+        raise ValueError(f"Unsupported executor: '{executor}'.")
+
+    import concurrent.futures
+
+    with getattr(concurrent.futures, pool_name)(max_workers=workers) as pool:
+        yield from pool.map(function, file_paths)
+
+
+def parse_files(
+    config_data: Dict,
+    path: AnyStr,
+    files: List,
+    workers: int = 0,
+    executor: str = "thread",
+):
+    """Parse several configuration files and merge them in order.
+
+    Args:
+        config_data (Dict): Dictionary updated in-place with the parsed data.
+        path (AnyStr): Directory path where the configuration files are located.
+        files (List): Names of the configuration files, in merge order.
+        workers (int): Size of the worker pool. 0 parses sequentially.
+        executor (str): "thread" or "process" pool for parallel parsing.
+
+    Raises:
+        ValueError: If the executor name is not supported.
+
+    Note:
+        Results are merged in the order of `files`, so parallel and
+        sequential loads are identical.
+    """
+    file_paths = [os.path.join(path, file) for file in files]
+    for result in parse_many(file_paths, workers, executor):
+        config_data.update(result)
+
+
+def parse_layers(
+    path: AnyStr,
+    entries: List[Tuple[str, StatFingerprint]],
+    workers: int = 0,
+    executor: str = "thread",
+    profile: Optional[Dict[str, "FileStats"]] = None,
+) -> List[Tuple[str, Layer]]:
+    """Parse files into layers, reusing the ones already parsed in this process.
+
+    Args:
+        path (AnyStr): Directory path where the configuration files are located.
+        entries (List[Tuple[str, StatFingerprint]]): Names of the files to parse
+        with their current stat fingerprint.
+        workers (int): Size of the worker pool. 0 parses sequentially.
+        executor (str): "thread" or "process" pool for parallel parsing.
+        profile (Optional[Dict[str, FileStats]]): Receives the statistics of
+        the parsed files, see `parse_many`.
+
+    Returns:
+        List[Tuple[str, Layer]]: Each filename with its layer, in the order of
+        `entries`.
+
+    Note:
+        Layers are looked up in the process-wide parse cache by stat fingerprint
+        and parser, so managers loading overlapping files, directly or through
+        symlinks, parse each of them once; only the misses are parsed, then
+        cached. A file's entry is dropped once it changes, or once a load finds
+        it removed.
+    """
+    layers, misses = {}, []
+    for file, fingerprint in entries:
+        file_path = os.path.abspath(os.path.join(path, file))
+        key = (fingerprint, ParserFactory.get_parser(file))
+        previous = _cache_keys.get(file_path)
+        if previous is not None and previous != key:
+            _parse_cache.pop(previous, None)
+        _cache_keys[file_path] = key
+
+        cached = _parse_cache.get(key)
+        if cached is not None:
+            layers[file] = cached
+        else:
+            misses.append((file, file_path, key))
+
+    parsed = parse_many([file_path for _, file_path, _ in misses], workers, executor, profile)
+    for (file, _, key), data in zip(misses, parsed):
+        layers[file] = _parse_cache[key] = (key[0], data)
+    return [(file, layers[file]) for file, _ in entries]
+
+
+def update_parse_cache(path: AnyStr, layers: Dict[str, Layer]):
+    """Replace cached layers by equivalent ones, e.g. frozen copies.
+
+    Args:
+        path (AnyStr): Directory path where the configuration files are located.
+        layers (Dict[str, Layer]): Layers keyed by filename. Only the cache
+        entries with the same stat fingerprint are replaced.
+    """
+    for file, layer in layers.items():
+        key = _cache_keys.get(os.path.abspath(os.path.join(path, file)))
+        if key in _parse_cache and key[0] == layer[0]:
+            _parse_cache[key] = layer
+
+
+def evict_parse_cache(path: AnyStr, files: Iterable[str]):
+    """Drop the cached layers of files that were removed.
+
+    Args:
+        path (AnyStr): Directory path where the configuration files were located.
+        files (Iterable[str]): Names of the removed files.
+    """
+    for file in files:
+        key = _cache_keys.pop(os.path.abspath(os.path.join(path, file)), None)
+        if key is not None:
+            _parse_cache.pop(key, None)
+
+
+def clear_parse_cache():
+    """Drop every layer of the process-wide parse cache."""
+    _parse_cache.clear()
+    _cache_keys.clear()
+
+
+def stat_fingerprint(file_path: AnyStr) -> StatFingerprint:
+    """Cheap fingerprint telling whether a file changed since it was parsed.
+
+    Args:
+        file_path (AnyStr): Path of the configuration file.
+
+    Returns:
+        StatFingerprint: Tuple of (mtime in nanoseconds, size, inode, device).
+        Inodes are only unique within a device, so files of different mounts
+        never share a fingerprint, nor a parse cache entry.
+    """
+    stat = os.stat(file_path)
+    return stat.st_mtime_ns, stat.st_size, stat.st_ino, stat.st_dev
+
+
+def load_layers(
+    path: AnyStr,
+    files: List,
+    layers: Dict[str, Layer],
+    options: ParseOptions = ParseOptions(),
+) -> Tuple[Dict[str, Layer], Set[str]]:
+    """Parse configuration files into per-file layers, reusing unchanged ones.
+
+    Args:
+        path (AnyStr): Directory path where the configuration files are located.
+        files (List): Names of the configuration files, in merge order.
+        layers (Dict[str, Layer]): Layers of a previous load, keyed by filename.
+        Pass an empty dict to parse every file.
+        options (ParseOptions): How the changed files are parsed, and whether
+        they are profiled.
+
+    Returns:
+        Tuple[Dict[str, Layer], Set[str]]: The new layers, mapping each filename
+        to its stat fingerprint and parsed data, and the names of the files
+        that were parsed again, added or removed.
+
+    Note:
+        Only files whose stat fingerprint differs from the previous layer are
+        parsed, unless the parse cache holds them already (see `parse_layers`);
+        the `layers` argument itself is never modified. Fingerprints are
+        taken before parsing, so a file modified while being parsed is picked
+        up again by the next load.
+    """
+    new_layers = {}
+    stale = []
+    for file in files:
+        fingerprint = stat_fingerprint(os.path.join(path, file))
+        previous = layers.get(file)
+        if previous is not None and previous[0] == fingerprint:
+            new_layers[file] = previous
+        else:
+            stale.append((file, fingerprint))
+
+    new_layers.update(parse_layers(path, stale, *options))
+
+    removed = layers.keys() - new_layers.keys()
+    evict_parse_cache(path, removed)
+    return new_layers, {file for file, _ in stale} | removed
+
+
+def scan_layers(
+    path: AnyStr,
+    files: List,
+    layers: Dict[str, Layer],
+    pending: Dict[str, Pending],
+    options: ParseOptions = ParseOptions(),
+) -> Tuple[Dict[str, Layer], Dict[str, Pending], Set[str]]:
+    """Lazy counterpart of `load_layers`: index files by key instead of parsing them.
+
+    Changed files whose parser can list their top-level keys cheaply are only
+    scanned and left pending; the others are parsed right away.
+
+    Args:
+        path (AnyStr): Directory path where the configuration files are located.
+        files (List): Names of the configuration files, in merge order.
+        layers (Dict[str, Layer]): Parsed layers of a previous load.
+        pending (Dict[str, Pending]): Pending files of a previous load, mapping
+        each filename to its stat fingerprint and scanned top-level keys.
+        options (ParseOptions): How the changed files are parsed.
+
+    Returns:
+        Tuple[Dict[str, Layer], Dict[str, Pending], Set[str]]: The new parsed
+        layers, the new pending files and the names of the files that were
+        scanned or parsed again, added or removed.
+
+    Note:
+        A pending file sharing a top-level key with a parsed layer is parsed
+        too, so the merged view never serves a key another file overrides.
+    """
+    new_layers, new_pending = {}, {}
+    changed, stale = set(), []
+    for file in files:
+        file_path = os.path.join(path, file)
+        fingerprint = stat_fingerprint(file_path)
+        previous = layers.get(file) or pending.get(file)
+        if previous is not None and previous[0] == fingerprint:
+            if file in layers:
+                new_layers[file] = previous
+            else:
+                new_pending[file] = previous
+            continue
+
+        changed.add(file)
+        keys = ParserFactory.get_parser(file).keys(file_path)
+        if keys is None:
+            stale.append((file, fingerprint))
+        else:
+            new_pending[file] = (fingerprint, frozenset(keys))
+
+    new_layers.update(parse_layers(path, stale, *options))
+
+    parsed_keys = set().union(*(data.keys() for _, data in new_layers.values()))
+    conflicts = [file for file, (_, keys) in new_pending.items() if not keys.isdisjoint(parsed_keys)]
+    parse_pending(path, new_layers, new_pending, conflicts, options)
+
+    removed = (layers.keys() | pending.keys()) - new_layers.keys() - new_pending.keys()
+    evict_parse_cache(path, removed)
+    return new_layers, new_pending, changed | removed
+
+
+def parse_pending(
+    path: AnyStr,
+    layers: Dict[str, Layer],
+    pending: Dict[str, Pending],
+    files: List,
+    options: ParseOptions = ParseOptions(),
+) -> Set[str]:
+    """Parse pending files, and every pending file sharing a key with them.
+
+    Args:
+        path (AnyStr): Directory path where the configuration files are located.
+        layers (Dict[str, Layer]): Parsed layers, updated in-place.
+        pending (Dict[str, Pending]): Pending files, updated in-place.
+        files (List): Names of the pending files to parse.
+        options (ParseOptions): How the files are parsed.
+
+    Returns:
+        Set[str]: Names of all the files that were parsed.
+    """
+    parsed = set()
+    batch = [file for file in dict.fromkeys(files) if file in pending]
+    while batch:
+        entries = [(file, pending.pop(file)[0]) for file in batch]
+        keys = set()
+        for file, layer in parse_layers(path, entries, *options):
+            layers[file] = layer
+            keys.update(layer[1].keys())
+        parsed.update(batch)
+        batch = [file for file, (_, pending_keys) in pending.items() if not pending_keys.isdisjoint(keys)]
+    return parsed
+
+
+def merge_layers(
+    files: List,
+    layers: Dict[str, Layer],
+    dicts: str = "replace",
+    lists: str = "replace",
+    provenance: Optional[Provenance] = None,
+) -> Dict:
+    """Merge per-file layers into the flat configuration view.
+
+    Args:
+        files (List): Names of the configuration files, in merge order.
+        Later files override the keys of earlier ones, names without a
+        layer are skipped.
+        layers (Dict[str, Layer]): Layers returned by `load_layers`.
+        dicts (str): "replace" lets a later file replace a whole section
+        (default), "merge" merges sections key by key, recursively.
+        lists (str): "replace" lets a later file replace a list (default),
+        "append" concatenates the lists in file order and "unique" only
+        appends the items not present yet.
+        provenance (Optional[Provenance]): Receives, from the same pass, the
+        files each value comes from, keyed by dotted path. Only the paths a
+        file set are recorded: a value nested in a section taken whole from
+        a file is attributed to the closest recorded parent, see `value_sources`.
+
+    Returns:
+        Dict: The merged configuration data. Layers are never modified: the
+        sections and lists that were merged are copies, the others are shared.
+
+    Raises:
+        ValueError: If a strategy is not supported.
+    """
+    if dicts not in DICT_STRATEGIES:
+        raise ValueError(f"Unsupported dict merge strategy: '{dicts}'.")
+    if lists not in LIST_STRATEGIES:
+        raise ValueError(f"Unsupported list merge strategy: '{lists}'.")
+
+    config_data = {}
+    if dicts == "replace" and lists == "replace":
+        for file in files:
+            layer = layers.get(file)
+            if layer is not None:
+                config_data.update(layer[1])
+                if provenance is not None:
+                    source = (file,)
+                    provenance.update({str(key): source for key in layer[1]})
+        return config_data
+
+    context = _MergeContext(dicts == "merge", lists, provenance)
+    for file in files:
+        layer = layers.get(file)
+        if layer is not None:
+            context.source = (file,)
+            _merge_section(config_data, layer[1], "", context)
+    return config_data
+
+
+class _MergeContext:
+    """State of one `merge_layers` call, shared by its `_merge_section` calls.
+
+    Attributes:
+        deep (bool): Merge sections key by key instead of replacing them.
+        lists (str): List strategy, see `merge_layers`.
+        provenance (Optional[Provenance]): Receives the sources of the values.
+        owned (Dict[int, Any]): Sections and lists created by the merge, keyed
+        by id: only those are updated in place, the others belong to a layer
+        and are copied first.
+        source (Tuple[str]): File of the layer being merged.
+    """
+
+    __slots__ = ("deep", "lists", "provenance", "owned", "source")
+
+    def __init__(self, deep: bool, lists: str, provenance: Optional[Provenance]):
+        self.deep = deep
+        self.lists = lists
+        self.provenance = provenance
+        self.owned = {}
+        self.source = ()
+
+
+def _merge_section(target: Dict, section: Dict, prefix: str, context: _MergeContext):
+    """Merge a section of a layer into the merged section at the same path."""
+    provenance, owned, source = context.provenance, context.owned, context.source
+    for key, value in section.items():
+        path = f"{prefix}{key}"
+        current = target.get(key, _MISSING)
+
+        if context.deep and isinstance(value, dict) and isinstance(current, dict):
+            if id(current) not in owned:
+                current = target[key] = dict(current)
+                owned[id(current)] = current
+            _merge_section(current, value, f"{path}.", context)
+            continue
+
+        if context.lists != "replace" and isinstance(value, (list, tuple)) and isinstance(current, (list, tuple)):
+            if id(current) not in owned:
+                current = target[key] = list(current)
+                owned[id(current)] = current
+            if context.lists == "append":
+                current.extend(value)
+            else:
+                current.extend(item for item in value if item not in current)
+            if provenance is not None:
+                previous = _closest_sources(provenance, path)
+                if source[0] not in previous:
+                    provenance[path] = previous + source
+            continue
+
+        if provenance is not None:
+            if isinstance(current, dict) and id(current) in owned:
+                _forget(provenance, current, path, owned)
+            provenance[path] = source
+        target[key] = value
+
+
+def _forget(provenance: Provenance, section: Dict, path: str, owned: Dict[int, Any]):
+    """Drop the provenance recorded under a merged section that gets replaced."""
+    for key, value in section.items():
+        child = f"{path}.{key}"
+        provenance.pop(child, None)
+        if isinstance(value, dict) and id(value) in owned:
+            _forget(provenance, value, child, owned)
+
+
+def _closest_sources(provenance: Provenance, path: str) -> Tuple[str, ...]:
+    """Sources recorded for a path, or for its closest recorded parent."""
+    while True:
+        found = provenance.get(path)
+        if found is not None:
+            return found
+        path, dot, _ = path.rpartition(".")
+        if not dot:
+            return ()
+
+
+def value_sources(provenance: Provenance, key: str, files: Iterable[str] = ()) -> Tuple[str, ...]:
+    """List the sources of a value from the provenance recorded by `merge_layers`.
+
+    Args:
+        provenance (Provenance): Provenance of the merged configuration data.
+        key (str): Top-level key or dotted path of the value.
+        files (Iterable[str]): Names of the configuration files in merge order,
+        to sort the sources by.
+
+    Returns:
+        Tuple[str, ...]: The sources that set the value, or for a section any
+        value inside it, in merge order; other sources, such as environment
+        variables, come last. Empty when no source is recorded.
+    """
+    found = list(_closest_sources(provenance, key))
+    prefix = f"{key}."
+    for path, path_sources in provenance.items():
+        if path.startswith(prefix):
+            found.extend(path_sources)
+    order = {file: rank for rank, file in enumerate(files)}
+    return tuple(sorted(dict.fromkeys(found), key=lambda source: order.get(source, len(order))))
+
+
+def environ_overrides(prefix: str, environ: Optional[Mapping[str, str]] = None) -> List[Override]:
+    """Collect the configuration values overridden through environment variables.
+
+    Args:
+        prefix (str): Prefix of the variables to collect, e.g. "ZE_".
+        environ (Optional[Mapping[str, str]]): Environment to scan
+        (default: os.environ).
+
+    Returns:
+        List[Override]: (path, value) pairs sorted by path, where the path is
+        the variable name without the prefix split on "__", so that
+        ZE_DATABASE__URL overrides "database.url". Names with an empty
+        segment are ignored.
+    """
+    if environ is None:
+        environ = os.environ
+    overrides = []
+    for name, value in environ.items():
+        if name.startswith(prefix):
+            path = tuple(name[len(prefix):].split("__"))
+            if all(path):
+                overrides.append((path, value))
+    overrides.sort()
+    return overrides
+
+
+def _match_key(section: Dict, segment: str) -> str:
+    """Find the key of a section an environment variable segment refers to.
+
+    The segment matches an existing key case-insensitively, a new key is
+    lowercased.
+    """
+    if segment in section:
+        return segment
+    lowered = segment.lower()
+    for key in section:
+        if isinstance(key, str) and key.lower() == lowered:
+            return key
+    return lowered
+
+
+def apply_overrides(
+    config_data: Dict,
+    overrides: List[Override],
+    provenance: Optional[Provenance] = None,
+    prefix: str = "",
+) -> Dict:
+    """Overlay environment overrides on the merged configuration data.
+
+    Args:
+        config_data (Dict): Merged configuration data, left unchanged.
+        overrides (List[Override]): Overrides returned by `environ_overrides`.
+        provenance (Optional[Provenance]): Provenance recorded by
+        `merge_layers`, updated in place with "env:<variable>" sources.
+        prefix (str): Prefix of the variables, to name them in `provenance`.
+
+    Returns:
+        Dict: The data with every override applied. Only the sections on the
+        path of an override are copied, the others are shared with
+        `config_data`. An override replaces a value that is not a section
+        when a longer path needs a section there.
+    """
+    if not overrides:
+        return config_data
+
+    config_data = dict(config_data)
+    copied = {id(config_data)}
+    for path, value in overrides:
+        section, keys = config_data, []
+        for segment in path[:-1]:
+            key = _match_key(section, segment)
+            keys.append(key)
+            child = section.get(key)
+            if not isinstance(child, dict):
+                child = {}
+            if id(child) not in copied:
+                child = dict(child)
+                copied.add(id(child))
+            section[key] = child
+            section = child
+        key = _match_key(section, path[-1])
+        section[key] = value
+        if provenance is not None:
+            dotted = ".".join(str(segment) for segment in (*keys, key))
+            provenance[dotted] = (f"env:{prefix}{'__'.join(path)}",)
+    return config_data
+
+
+def diff_config(old: Dict, new: Dict, keys: Iterable) -> Dict[str, Tuple[Any, Any]]:
+    """Compare two versions of the configuration data under some top-level keys.
+
+    Args:
+        old (Dict): Previous configuration data.
+        new (Dict): New configuration data.
+        keys (Iterable): Top-level keys to compare; the others are not visited.
+
+    Returns:
+        Dict[str, Tuple[Any, Any]]: The (old, new) values of every changed path,
+        keyed by dotted path. Sections present on both sides are compared key
+        by key, so only the values that differ are listed, and shared sections
+        are skipped without being visited. A missing value is None.
+    """
+    changes = {}
+    stack = [("", old, new, keys)]
+    while stack:
+        prefix, old_section, new_section, section_keys = stack.pop()
+        for key in section_keys:
+            old_value, new_value = old_section.get(key, _MISSING), new_section.get(key, _MISSING)
+            if old_value is new_value:
+                continue
+            path = f"{prefix}{key}"
+            if isinstance(old_value, dict) and isinstance(new_value, dict):
+                stack.append((f"{path}.", old_value, new_value, old_value.keys() | new_value.keys()))
+            elif type(old_value) is not type(new_value) or old_value != new_value:
+                changes[path] = (
+                    None if old_value is _MISSING else old_value,
+                    None if new_value is _MISSING else new_value,
+                )
+    return changes
+
+
+class PathIndex(dict):
+    """Dotted-path index of merged configuration data, filled on demand.
+
+    It holds the top-level keys from the start, so that their lookups are a
+    single dictionary probe. A dotted path to a nested value, such as
+    "database.primary.url", is resolved against the data the first time it is
+    looked up, with `index[key]` or `resolve`, and memoized in the index, so
+    that later lookups are a single probe too. Only the paths that are looked
+    up are ever stored, and each load builds a new index.
+
+    Attributes:
+        data (Dict): Merged configuration data the paths are resolved against.
+    """
+
+    __slots__ = ("data",)
+
+    def __init__(self, config_data: Dict):
+        super().__init__(config_data)
+        self.data = config_data
+
+    def __missing__(self, key: Any) -> Any:
+        value = self.resolve(key, _MISSING)
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+
+    def resolve(self, key: Any, default: Any = None) -> Any:
+        """Resolve a dotted path missing from the index and memoize its value.
+
+        Args:
+            key (Any): Key or dotted path to look up.
+            default (Any): Returned when no value is found.
+
+        Returns:
+            Any: The value at the path, or `default`.
+        """
+        if type(key) is not str or "." not in key:
+            return default
+        value = _resolve(self.data, key)
+        if value is _MISSING:
+            return default
+        self[key] = value
+        return value
+
+
+def _resolve(section: Dict, path: str) -> Any:
+    """Value at a dotted path below a section, a key containing dots matching before a nested one."""
+    if path in section:
+        return section[path]
+    dot = path.find(".")
+    while dot >= 0:
+        value = section.get(path[:dot], _MISSING)
+        if isinstance(value, dict):
+            found = _resolve(value, path[dot + 1:])
+            if found is not _MISSING:
+                return found
+        dot = path.find(".", dot + 1)
+    return _MISSING
+
+
+def build_index(config_data: Dict) -> PathIndex:
+    """Create the dotted-path index of merged configuration data.
+
+    Args:
+        config_data (Dict): Merged configuration data.
+
+    Returns:
+        PathIndex: Mapping of every top-level key to its value, in which every
+        dotted path to a nested value, e.g. "database.primary.url", nested
+        sections included, is found on first lookup and memoized. Building it
+        only copies the top level, whatever the depth of the data.
+
+    Note:
+        A top-level key that contains dots takes precedence over a nested path
+        with the same spelling.
+    """
+    return PathIndex(config_data)
+
+
+def is_config_file(file: AnyStr) -> bool:
+    """Check whether a file name has a supported configuration format.
+
+    Args:
+        file (AnyStr): Name of the file.
+
+    Returns:
+        bool: True when a parser is registered for the file in ParserFactory,
+        by default for .json, .toml, .yaml, .yml and .env files.
+    """
+    return ParserFactory.supports(file)
+
+
+def list_files(path: AnyStr) -> List:
+    """List the names of the regular files in a directory.
+
+    Args:
+        path (AnyStr): Path of the directory to scan.
+
+    Returns:
+        List: File names found in the directory, in scan order.
+    """
+    return [entry.name for entry in os.scandir(path) if entry.is_file()]
+
+
+def _matches(relative_path: str, patterns: Iterable[str]) -> bool:
+    """Check a relative path, or its bare name, against glob patterns."""
+    name = relative_path.rpartition("/")[2]
+    return any(fnmatchcase(relative_path, pattern) or fnmatchcase(name, pattern) for pattern in patterns)
+
+
+def _walk(root: AnyStr, recursive: bool, exclude: Tuple) -> Tuple[Dict[str, int], List[str]]:
+    """Walk a directory tree, pruning excluded directories.
+
+    Returns:
+        Tuple[Dict[str, int], List[str]]: The mtime of every directory walked
+        and the relative POSIX paths of the files found.
+    """
+    directories, files = {}, []
+    stack = [(os.fspath(root), "")]
+    while stack:
+        directory, prefix = stack.pop()
+        directories[directory] = os.stat(directory).st_mtime_ns
+        for entry in os.scandir(directory):
+            relative_path = prefix + entry.name
+            if entry.is_file():
+                files.append(relative_path)
+            elif recursive and entry.is_dir(follow_symlinks=False) and not _matches(relative_path, exclude):
+                stack.append((entry.path, relative_path + "/"))
+    return directories, files
+
+
+def _manifest_is_fresh(directories: Dict[str, int]) -> bool:
+    """Check that no walked directory was modified since the scan."""
+    try:
+        return all(os.stat(directory).st_mtime_ns == mtime for directory, mtime in directories.items())
+    except FileNotFoundError:
+        return False
+
+
+def discover_files(
+    root: AnyStr,
+    recursive: bool = False,
+    include: Iterable[str] = ("*",),
+    exclude: Iterable[str] = (),
+    layers: Iterable[str] = (),
+) -> List[str]:
+    """Discover the files of a configuration tree, in merge order.
+
+    Args:
+        root (AnyStr): Directory to scan.
+        recursive (bool): Also scan subdirectories (default: False).
+        include (Iterable[str]): Glob patterns a file must match (default: all).
+        exclude (Iterable[str]): Glob patterns of files and directories to skip.
+        layers (Iterable[str]): Glob patterns of the precedence layers, lowest
+        first, e.g. ("*/base/*", "*/prod/*", "*/local/*").
+
+    Returns:
+        List[str]: Paths relative to `root`, with "/" separators. Files matching
+        no layer come first, then each layer in order; within a layer files are
+        sorted by path. Later files override the keys of earlier ones.
+
+    Note:
+        Patterns are matched against the relative path and against the bare
+        name, and `*` also matches "/". The scan plan is cached per root and
+        options; as long as no scanned directory has a new mtime, the cached
+        plan is reused without walking the tree again.
+    """
+    include, exclude, layers = tuple(include), tuple(exclude), tuple(layers)
+    key = (os.fspath(root), recursive, include, exclude, layers)
+
+    manifest = _manifests.get(key)
+    if manifest is not None and _manifest_is_fresh(manifest[0]):
+        return list(manifest[1])
+
+    directories, files = _walk(root, recursive, exclude)
+    files = [file for file in files if _matches(file, include) and not _matches(file, exclude)]
+
+    def precedence(file: str) -> Tuple[int, str]:
+        rank = 0
+        for number, pattern in enumerate(layers, 1):
+            if fnmatchcase(file, pattern):
+                rank = number
+        return rank, file
+
+    files.sort(key=precedence)
+    _manifests[key] = (directories, files)
+    return list(files)
+
+
 def get_file_data(
     config_files: List,
     config_data:  Dict,
-    path: AnyStr
+    path: AnyStr,
+    workers: int = 0,
+    executor: str = "thread",
 ):
     """Collect and process configuration files from a directory.
     
@@ -45,22 +941,15 @@ def get_file_data(
         config_files (List): List to be populated with filenames found in the directory.
         config_data (Dict): Dictionary to store aggregated configuration data.
         path (AnyStr): Path of the directory to scan for configuration files.
+        workers (int): Size of the worker pool used for parsing. 0 parses sequentially.
+        executor (str): "thread" or "process" pool for parallel parsing.
         
     Note:
-        Processes files with the following extensions: .json, .toml, .yaml, .yml.
-        Skips files with unsupported extensions.
+        Processes files with a parser registered in ParserFactory, by default
+        .json, .toml, .yaml, .yml and .env. Skips files with unsupported extensions.
     """
     
-    for entry in os.scandir(path):
-        if entry.is_file():
-            config_files.append(entry.name)
+    config_files.extend(list_files(path))
     
-    for file in config_files:
-        if file.endswith(".json"):
-            parse_data(config_data, path, file)
-        elif file.endswith(".toml"):
-            parse_data(config_data, path, file)
-        elif file.endswith((".yaml", ".yml")):
-            parse_data(config_data, path, file)
-        elif file.endswith(".env") or file.startswith(".env"):
-            parse_data(config_data, path, file)
+    sources = [file for file in config_files if is_config_file(file)]
+    parse_files(config_data, path, sources, workers, executor)
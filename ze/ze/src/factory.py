@@ -1,4 +1,5 @@
-from pathlib import Path
+import os
+from typing import Dict, Iterable, Type, Union
 
 from .models import ConfigParser, ENVParser, JSONParser, TOMLParser, YAMLParser
 
@@ -6,18 +7,81 @@ from .models import ConfigParser, ENVParser, JSONParser, TOMLParser, YAMLParser
 class ParserFactory:
     """Factory class that returns the correct parser
     based on the file extension.
+
+    Parsers are registered per suffix and kept as
+    singletons: every lookup returns the same instance.
     """
 
-    _parsers = {
-        '.json': JSONParser,
-        '.toml': TOMLParser,
-        '.yml': YAMLParser,
-        '.yaml': YAMLParser,
-        '.env': ENVParser,
-    }
+    _parsers: Dict[str, ConfigParser] = {}
+
+    @classmethod
+    def register(
+        cls,
+        suffixes: Union[str, Iterable[str]],
+        parser: Union[ConfigParser, Type[ConfigParser]],
+    ):
+        """
+        Registers a parser for one or more file
+        extensions, replacing any previous one.
+
+        Args:
+            suffixes (Union[str, Iterable[str]]): File
+            extension(s) including the dot, e.g. '.json'.
+            parser (Union[ConfigParser, Type[ConfigParser]]):
+            Parser instance, or parser class to instantiate
+            once.
+
+        Raises:
+            TypeError: If the parser is not a ConfigParser.
+        """
+        if isinstance(parser, type):
+            parser = parser()
+        if not isinstance(parser, ConfigParser):
+            raise TypeError(f"Parser must be a ConfigParser, got {type(parser).__name__}.")
+
+        if isinstance(suffixes, str):
+            suffixes = (suffixes,)
+        for suffix in suffixes:
+            cls._parsers[suffix] = parser
+
+    @classmethod
+    def unregister(cls, suffix: str):
+        """
+        Removes the parser registered for a file
+        extension, if any.
 
-    @staticmethod
-    def get_parser(file_path: str) -> ConfigParser:
+        Args:
+            suffix (str): File extension including the dot.
+        """
+        cls._parsers.pop(suffix, None)
+
+    @classmethod
+    def _suffix(cls, file_path: str) -> str:
+        """
+        Returns the registry key of a file: its extension,
+        or for dotfiles such as '.env' or '.env.local'
+        the leading name.
+        """
+        name = os.path.basename(file_path)
+        ext = os.path.splitext(name)[1]
+        if ext in cls._parsers or not name.startswith("."):
+            return ext or name
+        return "." + name[1:].split(".", 1)[0]
+
+    @classmethod
+    def supports(cls, file_path: str) -> bool:
+        """
+        Checks whether a parser is registered for
+        the given file.
+
+        Args:
+            file_path (str): Path to the configuration
+            file.
+        """
+        return cls._suffix(file_path) in cls._parsers
+
+    @classmethod
+    def get_parser(cls, file_path: str) -> ConfigParser:
         """
         Returns the appropriate parser for the given
         file extension.
@@ -27,17 +91,23 @@ class ParserFactory:
             file.
 
         Returns:
+            ConfigParser: The registered parser instance.
+
+        Raises:
             ValueError: If the file extension is not
             supported.
         """
 
-        ext = Path(file_path).suffix
-        if not ext:
-            ext = Path(file_path).name
+        ext = cls._suffix(file_path)
+        parser = cls._parsers.get(ext)
 
-        parser_class = ParserFactory._parsers.get(ext)
-
-        if not parser_class:
+        if not parser:
             raise ValueError(f"Unsupported file extension: '{ext}'.")
 
-        return parser_class()
+        return parser
+
+
+ParserFactory.register(".json", JSONParser)
+ParserFactory.register(".toml", TOMLParser)
+ParserFactory.register((".yml", ".yaml"), YAMLParser)
+ParserFactory.register(".env", ENVParser)
@@ -0,0 +1,61 @@
+import sys
+from typing import Any, Dict, Optional
+
+
+def _readonly(*args, **kwargs):
+    raise TypeError('Frozen configuration sections are read-only')
+
+
+class FrozenDict(dict):
+    """Read-only dict holding a frozen configuration section.
+
+    It is still a dict, so lookups, iteration, `json.dumps` and `isinstance`
+    checks behave as usual, but every method that would modify it raises
+    TypeError. No `__dict__` is allocated, an instance is as small as a dict.
+    """
+
+    __slots__ = ()
+
+    __setitem__ = __delitem__ = __ior__ = _readonly
+    clear = pop = popitem = setdefault = update = _readonly
+
+    def __copy__(self) -> 'FrozenDict':
+        return self
+
+    def __deepcopy__(self, memo: Dict) -> 'FrozenDict':
+        return self
+
+    def __reduce__(self):
+        return FrozenDict, (dict(self),)
+
+
+def freeze(value: Any, memo: Optional[Dict] = None) -> Any:
+    """Build a compact, immutable copy of a parsed configuration value.
+
+    Dicts become FrozenDict with interned keys, lists become tuples, and equal
+    scalars share a single object.
+
+    Args:
+        value (Any): Parsed configuration data.
+        memo (Optional[Dict]): Canonical scalars, shared between calls so that
+        equal values of several files are deduplicated too.
+
+    Returns:
+        Any: The frozen value. Values that are already frozen are returned
+        as they are.
+    """
+    if memo is None:
+        memo = {}
+    if isinstance(value, FrozenDict):
+        return value
+    if isinstance(value, dict):
+        return FrozenDict(
+            (sys.intern(key) if type(key) is str else key, freeze(item, memo)) for key, item in value.items()
+        )
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze(item, memo) for item in value)
+    try:
+        # Keyed by type as well, so that 1, 1.0 and True stay distinct.
+        return memo.setdefault((type(value), value), value)
+    except TypeError:
+        return value
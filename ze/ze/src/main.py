@@ -1,4 +1,5 @@
 from .manager import ConfigManager
 
-# Singleton instance for easy access
-config = ConfigManager.get
+# Default instance for easy access
+manager = ConfigManager()
+config = manager.get
@@ -1,74 +1,994 @@
+import gc
+import os
+import threading
+import time
+from datetime import timedelta
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Any, Callable, Dict, Hashable, List, Optional, Set, Tuple, Union
 
-from .core import get_file_data
+from .converters import to_bool, to_duration, to_int, to_list
+from .core import (
+    ParseOptions,
+    apply_overrides,
+    build_index,
+    diff_config,
+    discover_files,
+    environ_overrides,
+    evict_parse_cache,
+    is_config_file,
+    load_layers,
+    merge_layers,
+    parse_pending,
+    scan_layers,
+    stat_fingerprint,
+    update_parse_cache,
+    value_sources,
+)
 from .settings import settings
 
+if TYPE_CHECKING:
+    import asyncio
+
+    from .stats import LoadStats
+    from .watcher import PollingWatcher
+
+_MISSING = object()
+
+
+def _descend(value: Any, path: str) -> Any:
+    """Value at a dotted path below a section, or None when it is missing."""
+    for segment in path.split("."):
+        if not isinstance(value, dict):
+            return None
+        value = value.get(segment)
+    return value
+
+
+class _instance_or_default:
+    """Method that reads the default manager when it is called on the class.
+
+    `ConfigManager.get` was a classmethod before every manager held its own
+    state, so `ConfigManager.get(key)` keeps reading the default instance of
+    ze.src.main. On an instance, the bound method is stored in the instance
+    dict on first access, so later lookups skip the descriptor.
+    """
+
+    def __init__(self, function: Callable):
+        self.function = function
+        self.__doc__ = function.__doc__
+
+    def __get__(self, instance: Optional["ConfigManager"], owner: Optional[type] = None) -> Callable:
+        if instance is None:
+            from .main import manager
+
+            return self.function.__get__(manager, owner)
+        bound = instance.__dict__[self.function.__name__] = self.function.__get__(instance, owner)
+        return bound
+
 
 class ConfigManager:
     """Central configuration management handler with lazy-loaded file parsing.
 
-    Implements a singleton-like pattern to manage application configuration through
-    various file formats. Automatically searches for configuration files in either
-    CONF_DIR or BASE_DIR locations defined in settings.
+    Manages the application configuration loaded from a directory of files in
+    various formats. Every instance holds its own directory, layers, index and
+    caches, so one process can serve several tenants or directories; parsed
+    files are shared between instances through the process-wide parse cache of
+    the core module, so a file used by many managers is parsed once. The package
+    level `config` accessor is bound to a default instance.
 
-    Class Attributes:
+    Args:
+        root: Directory to load the configuration files from. When None, the
+            CONF_DIR or BASE_DIR of settings is used, whichever exists first.
+        schema: Optional Schema, dict schema or dataclass the configuration is
+            validated against on every load and reload, see ze.src.schema.
+
+    Attributes:
+        _root (Optional[Path]): Directory given to the constructor
+        _schema (Optional[Schema]): Compiled schema given to the constructor
         _files_checked (bool): Flag indicating if configuration files have been loaded
         _config_data (Dict): Cache storing combined configuration data
+        _config_path (Optional[Path]): Directory the configuration was loaded from
         _config_files (List): Collection of discovered configuration filenames
+        _layers (Dict): Per-file layers, mapping each parsed filename to its stat
+            fingerprint and parsed data
+        _pending (Dict): Files scanned but not parsed yet in lazy mode, mapping
+            each filename to its stat fingerprint and top-level keys
+        _index (PathIndex): Dotted-path index of _config_data used by `get`,
+            filled with the nested paths as they are looked up
+        _provenance (Dict): Sources of the values of _config_data by dotted
+            path, recorded while merging, see `explain`
+        _lazy_index (Dict): Top-level keys of the pending files, mapped to the
+            files defining them
+        _coerced (Dict): Memo of typed accessor results keyed by (key, type),
+            replaced on every load or reload
+        _watcher_thread (Optional[Thread]): Background thread started by `watch`
+        _watcher_stop (Optional[Event]): Event telling the watcher thread to exit
+        _write_lock (Lock): Serializes the initial load, reloads and lazy parsing,
+            readers never take it
+        _sharing_pid (Optional[int]): Set by `share` to the id of the process
+            that publishes the configuration to settings.SHARED_FILE; processes
+            forked from it are workers
+        _artifact_fingerprint (Optional[Tuple]): Stat fingerprint of the
+            settings.ARTIFACT file last loaded, None when none was
+        _shared_generation (Optional[int]): Generation of the shared configuration
+            last published or attached by this process
+        _load_task (Optional[Future]): Initial load started by `aload`, awaited
+            by every coroutine that needs the configuration before it is loaded
+        _stats (Optional[LoadStats]): Pipeline statistics, collected while
+            settings.STATS is set
+        _stats_hooks (List[Callable]): Callbacks receiving the statistics after
+            every load
+        _stats_due (bool): Set when a load was published and the statistics
+            hooks were not called for it yet
+        _overrides (List): Environment overrides applied by the last load
+        _fingerprints (Dict): Snapshot fingerprints of the files, keyed by path,
+            whose content hashes are reused while their stat is unchanged
+        _subscribers (List[Tuple[str, Callable]]): Keys or prefixes watched with
+            `on_change`, with their callbacks
+
+    Note:
+        The other settings apply to every instance. CACHE_FILE and SHARED_FILE
+        name a single file, so they are meant for processes using one manager.
     """
 
-    _files_checked = False
-    _config_data = {}
-    _config_files = []
+    def __init__(self, root: Optional[Union[str, os.PathLike]] = None, schema: Any = None):
+        self._root = Path(root) if root is not None else None
+        self._schema = None
+        if schema is not None:
+            from .schema import compile_schema
+
+            self._schema = compile_schema(schema)
+        self._files_checked = False
+        self._config_data = {}
+        self._config_path = None
+        self._config_files = []
+        self._layers = {}
+        self._pending = {}
+        self._index = build_index({})
+        self._provenance = {}
+        self._lazy_index = {}
+        self._coerced = {}
+        self._watcher_thread = None
+        self._watcher_stop = None
+        self._write_lock = threading.Lock()
+        self._sharing_pid = None
+        self._artifact_fingerprint = None
+        self._shared_generation = None
+        self._load_task = None
+        self._stats = None
+        self._stats_hooks = []
+        self._stats_due = False
+        self._overrides = []
+        self._fingerprints = {}
+        self._subscribers = []
 
-    @classmethod
-    def _load_config_files(cls):
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({os.fspath(self._root) if self._root else None!r})"
+
+    def _config_dir(self) -> Optional[Path]:
+        """Return the directory configuration files are loaded from.
+
+        Returns:
+            The root given to the constructor when it exists, else CONF_DIR
+            when it exists, else BASE_DIR when it exists, else None
+        """
+        if self._root is not None:
+            return self._root if self._root.exists() else None
+        if Path(settings.CONF_DIR).exists():
+            return Path(settings.CONF_DIR)
+        if Path(settings.BASE_DIR).exists():
+            return Path(settings.BASE_DIR)
+        return None
+
+    @staticmethod
+    def _discover(path: Path) -> List:
+        """List the files of the configuration directory in merge order.
+
+        Args:
+            path: Directory containing the configuration files
+
+        Note:
+            Uses the RECURSIVE, INCLUDE, EXCLUDE and LAYERS settings.
+        """
+        return discover_files(path, settings.RECURSIVE, settings.INCLUDE, settings.EXCLUDE, settings.LAYERS)
+
+    def _parse_options(self) -> ParseOptions:
+        """Worker count, executor and statistics sink passed to the parsing functions."""
+        profile = self.stats().files if settings.STATS else None
+        return ParseOptions(settings.PARSE_WORKERS, settings.PARSE_EXECUTOR, profile)
+
+    def _read_config(self, path: Path, layers: Dict, pending: Dict) -> Tuple[List, Dict, Dict, Set]:
+        """Discover the configuration files of a directory and parse the changed ones.
+
+        Args:
+            path: Directory containing the configuration files
+            layers: Per-file layers of the previous load, empty on the first one
+            pending: Files of the previous load that were scanned but not parsed
+
+        Returns:
+            Tuple of the discovered filenames, the new per-file layers, the new
+            pending files and the names of the files that were parsed or scanned
+            again, added or removed. Nothing is published to readers.
+
+        Note:
+            When settings.CACHE_FILE is set, the first load reads the layers from
+            the snapshot instead of parsing the files, as long as it is up to
+            date, and every load that changes a layer refreshes the snapshot.
+            Only the first load hashes every file; later ones hash the files
+            whose mtime or size changed and reuse the other hashes.
+            When settings.LAZY_LOAD is set, files are only scanned for their
+            top-level keys where possible and parsed on first lookup.
+        """
+        start = time.perf_counter()
+        config_files = self._discover(path)
+        if settings.STATS:
+            self.stats().discovery_seconds = time.perf_counter() - start
+        sources = [file for file in config_files if is_config_file(file)]
+
+        if settings.CACHE_FILE:
+            from .cache import file_fingerprint, load_snapshot
+
+            known = self._fingerprints
+            file_paths = [os.path.join(path, file) for file in sources]
+            fingerprints = [file_fingerprint(file_path, known.get(file_path)) for file_path in file_paths]
+            self._fingerprints = {fingerprint[0]: fingerprint for fingerprint in fingerprints}
+            if not layers and not pending:
+                snapshot = load_snapshot(settings.CACHE_FILE, fingerprints)
+                if snapshot is not None:
+                    return config_files, snapshot, {}, set(snapshot)
+
+        if settings.LAZY_LOAD:
+            new_layers, new_pending, changed = scan_layers(path, sources, layers, pending, self._parse_options())
+        else:
+            new_layers, changed = load_layers(path, sources, layers, self._parse_options())
+            new_pending = {}
+
+        # A snapshot is only worth writing once every file has been parsed.
+        if settings.CACHE_FILE and changed and not new_pending:
+            from .cache import save_snapshot
+
+            save_snapshot(settings.CACHE_FILE, fingerprints, new_layers)
+        return config_files, new_layers, new_pending, changed
+
+    def _load_config_files(self):
         """Load configuration files from predefined directories.
 
         Searches configuration directories in this order:
-        1. Primary configuration directory (CONF_DIR from settings)
-        2. Fallback to base directory (BASE_DIR from settings)
+        1. Root directory given to the constructor, if any
+        2. Primary configuration directory (CONF_DIR from settings)
+        3. Fallback to base directory (BASE_DIR from settings)
 
         Note:
-            Executes only once per class lifecycle (idempotent operation).
-            Modifies class attributes _config_files and _config_data in-place.
+            Executes only once per manager (idempotent operation).
+            Replaces the attributes _config_files, _layers and _config_data.
+            When settings.SHARED_FILE is set, a worker process attaches the
+            configuration shared by its master instead of parsing the files,
+            as long as one was published. When settings.ARTIFACT names an
+            existing artifact, the files and layers are read from it without
+            discovering or parsing anything, even if the directory is missing.
+            When settings.FREEZE is set, every object alive is moved out of
+            reach of the cyclic garbage collector with `gc.freeze()` once this
+            first load is published, so that workers forked afterwards keep
+            sharing their pages with the parent. Reloads never freeze again,
+            as the configurations they replace could then never be collected.
+
+            Thread-safe: concurrent callers wait for a single load under
+            _write_lock. _files_checked is only set once the configuration is
+            published, so a thread that sees it set never reads partial data,
+            and a load that raises is attempted again by the next caller.
         """
 
-        if cls._files_checked:
+        if self._files_checked:
             return
 
-        cls._files_checked = True
+        with self._write_lock:
+            if self._files_checked:
+                return
 
-        if Path(settings.CONF_DIR).exists():
-            path = Path(settings.CONF_DIR)
-            get_file_data(cls._config_files, cls._config_data, path)
-        elif Path(settings.BASE_DIR).exists():
-            path = Path(settings.BASE_DIR)
-            get_file_data(cls._config_files, cls._config_data, path)
-
-    @classmethod
-    def get(cls, key: str, default: Optional[str] = None) -> Optional[str]:
+            if not (settings.SHARED_FILE and not self._is_master() and self._attach_shared() is not None):
+                self._load_sources()
+            if settings.FREEZE:
+                gc.freeze()
+            self._files_checked = True
+        self._call_stats_hooks()
+
+    def _load_sources(self):
+        """Publish the configuration of settings.ARTIFACT or, without one, of the directory.
+
+        Note:
+            Must be called with _write_lock held. The shared configuration is
+            not consulted and the files are parsed from scratch.
+        """
+        if settings.ARTIFACT and self._load_artifact() is not None:
+            return
+        path = self._config_dir()
+        if path is None:
+            self._publish(None, [], {}, {})
+            return
+        config_files, layers, pending, _ = self._read_config(path, {}, {})
+        self._publish(path, config_files, layers, pending)
+
+    def _publish(self, path: Optional[Path], config_files: List, layers: Dict, pending: Dict):
+        """Merge the layers and make the result visible to readers.
+
+        The merged data is fully built before being assigned, with a single
+        reference assignment, along with a new dotted-path index: the paths
+        memoized for the previous data are dropped with the previous index. The typed accessor
+        memo is replaced after the index, so a reader that sees the new memo
+        always converts values from the new index.
+
+        Args:
+            path: Directory the configuration files were loaded from
+            config_files: Discovered configuration filenames, in merge order
+            layers: Per-file layers to merge
+            pending: Files scanned but not parsed yet, with their top-level keys
+
+        Note:
+            When settings.ENV_PREFIX is set, the environment is scanned once
+            here and its overrides are applied on top of the merged files;
+            pending files defining an overridden key are parsed first, so that
+            the override lands on their complete section.
+            When the manager has a schema, the data is validated, with defaults
+            filled in and strings converted, before anything is published;
+            pending files defining a declared key are parsed first. A
+            configuration that fails validation raises ValueError and the
+            previous one stays active.
+            Layers are merged with the settings.MERGE_DICTS and MERGE_LISTS
+            strategies, recording the source of every value in the same pass.
+            When settings.FREEZE is set, the layers and the merged data are
+            frozen into read-only sections first.
+            When settings.STATS is set, lookups are counted by the published
+            index; the statistics hooks are called by `_call_stats_hooks` once
+            the caller released _write_lock.
+        """
+        start = time.perf_counter()
+        overrides = environ_overrides(settings.ENV_PREFIX) if settings.ENV_PREFIX else []
+        needed = {segments[0].lower() for segments, _ in overrides}
+        if self._schema is not None:
+            needed.update(key.lower() for key in self._schema.keys)
+        if needed and pending:
+            files = [file for file, (_, keys) in pending.items() if any(key.lower() in needed for key in keys)]
+            if files:
+                layers, pending = dict(layers), dict(pending)
+                parse_pending(path, layers, pending, files, self._parse_options())
+
+        if settings.FREEZE:
+            from .frozen import freeze
+
+            memo = {}
+            layers = {file: (fingerprint, freeze(data, memo)) for file, (fingerprint, data) in layers.items()}
+            if path is not None:
+                update_parse_cache(path, layers)
+        provenance = {}
+        config_data = merge_layers(config_files, layers, settings.MERGE_DICTS, settings.MERGE_LISTS, provenance)
+        config_data = apply_overrides(config_data, overrides, provenance, settings.ENV_PREFIX or "")
+        if self._schema is not None:
+            config_data = self._schema.validate(config_data)
+        if settings.FREEZE:
+            config_data = freeze(config_data, memo)
+        lazy_index = {}
+        for file, (_, keys) in pending.items():
+            for key in keys:
+                lazy_index.setdefault(key, []).append(file)
+
+        stats = self.stats() if settings.STATS else None
+        if stats is None:
+            index = build_index(config_data)
+        else:
+            from .stats import CountingIndex
+
+            index = CountingIndex(config_data, stats)
+            loaded = {os.path.abspath(os.path.join(path, file)) for file in layers} if path is not None else set()
+            stats.files = {file: file_stats for file, file_stats in stats.files.items() if file in loaded}
+            stats.publish_seconds = time.perf_counter() - start
+
+        self._config_path, self._config_files = path, config_files
+        self._layers, self._pending = layers, pending
+        self._config_data = config_data
+        self._index = index
+        self._provenance = provenance
+        self._overrides = overrides
+        self._lazy_index = lazy_index
+        self._coerced = {}
+        if stats is not None:
+            stats.loads += 1
+            self._stats_due = True
+
+    def _call_stats_hooks(self):
+        """Call the statistics hooks for the last published load, if not done yet.
+
+        Note:
+            Must be called without _write_lock held, once the configuration is
+            marked as loaded, so that hooks can read it.
+        """
+        if not self._stats_due:
+            return
+        self._stats_due = False
+        for hook in list(self._stats_hooks):
+            hook(self._stats)
+
+    def _parse_pending(self, key: str) -> bool:
+        """Parse the pending files that define a key missing from the index.
+
+        Args:
+            key: Configuration key that was not found; for a dotted path, the
+                files defining its first segment are parsed
+
+        Returns:
+            True when files were parsed and the lookup should be retried
+        """
+        files = self._lazy_index.get(key) or self._lazy_index.get(str(key).partition(".")[0])
+        if not files:
+            return False
+
+        with self._write_lock:
+            pending = dict(self._pending)
+            files = [file for file in files if file in pending]
+            if files:
+                layers = dict(self._layers)
+                parse_pending(self._config_path, layers, pending, files, self._parse_options())
+                self._publish(self._config_path, self._config_files, layers, pending)
+        self._call_stats_hooks()
+        return True
+
+    def reload(self) -> Set[str]:
+        """Re-parse the changed configuration files and swap in the new data.
+
+        Every file is stat'ed, but only the modified and added ones are parsed
+        again; the merged view is rebuilt from the cached per-file layers. It
+        is built aside and published with a single reference assignment, so
+        concurrent `get` calls see either the previous or the new configuration,
+        never a partially merged one. If parsing fails the exception propagates
+        and the previous configuration stays active.
+
+        With settings.SHARED_FILE set, a worker process attaches the latest
+        generation published by its master instead of parsing anything, and
+        the master publishes a new generation whenever a file changed. With
+        settings.ARTIFACT set, the artifact is the source of the configuration:
+        it is read again when it was replaced, and the files are not read.
+
+        Once the new configuration is published, the `on_change` subscribers
+        of the values that changed are called, outside of the lock.
+
+        Returns:
+            Names of the files that were parsed again, added or removed
+        """
+        with self._write_lock:
+            previous = (self._files_checked, self._config_data, self._layers, self._pending, self._overrides)
+            changed = None
+            if settings.SHARED_FILE and not self._is_master():
+                changed = self._attach_shared()
+                if changed is not None:
+                    self._files_checked = True
+            if changed is None and settings.ARTIFACT:
+                changed = self._load_artifact()
+                if changed is not None:
+                    self._files_checked = True
+
+            if changed is None:
+                path = self._config_dir()
+                if path is None:
+                    config_files, layers, pending = [], {}, {}
+                    changed = self._layers.keys() | self._pending.keys()
+                    if self._config_path is not None:
+                        evict_parse_cache(self._config_path, changed)
+                else:
+                    config_files, layers, pending, changed = self._read_config(path, self._layers, self._pending)
+
+                if self._files_checked and not changed:
+                    return changed
+
+                self._publish(path, config_files, layers, pending)
+                self._files_checked = True
+                if self._is_master():
+                    self._share()
+            changes = self._diff(previous, changed)
+        self._call_stats_hooks()
+        if changes:
+            self._notify(changes)
+        return changed
+
+    def _diff(self, previous: Tuple, changed: Set[str]) -> Dict[str, Tuple[Any, Any]]:
+        """Compute the values a reload changed, for the subscribers.
+
+        Only the top-level keys defined by the changed files, before or after
+        the reload, and the keys overridden by the environment are compared.
+
+        Args:
+            previous: Loaded flag, data, layers, pending files and overrides
+                captured before the reload
+            changed: Names of the files parsed again, added or removed
+
+        Returns:
+            The (old, new) values keyed by dotted path, empty when nobody
+            subscribed or nothing was loaded before
+        """
+        loaded, old_data, old_layers, old_pending, old_overrides = previous
+        if not self._subscribers or not loaded or old_data is self._config_data:
+            return {}
+
+        keys = set()
+        for file in changed:
+            for layers in (old_layers, self._layers):
+                if file in layers:
+                    keys.update(layers[file][1])
+            for pending in (old_pending, self._pending):
+                if file in pending:
+                    keys.update(pending[file][1])
+        overridden = {segments[0].lower() for segments, _ in (*old_overrides, *self._overrides)}
+        if overridden:
+            keys.update(
+                key
+                for key in old_data.keys() | self._config_data.keys()
+                if isinstance(key, str) and key.lower() in overridden
+            )
+        return diff_config(old_data, self._config_data, keys)
+
+    def _notify(self, changes: Dict[str, Tuple[Any, Any]]):
+        """Call the subscribers whose key or prefix is affected by the changes.
+
+        A callback that raises is logged and does not keep the others from
+        being called: the new configuration is already published by then.
+        """
+        for key, callback in list(self._subscribers):
+            matched = {}
+            for path, (old, new) in changes.items():
+                if path == key or path.startswith(f"{key}."):
+                    matched[path] = (old, new)
+                elif key.startswith(f"{path}."):
+                    # A parent of the key changed, e.g. a section became a value.
+                    rest = key[len(path) + 1:]
+                    old_value, new_value = _descend(old, rest), _descend(new, rest)
+                    if type(old_value) is not type(new_value) or old_value != new_value:
+                        matched[key] = (old_value, new_value)
+            if matched:
+                try:
+                    callback(matched)
+                except Exception:
+                    import logging
+
+                    logging.getLogger(__name__).exception("on_change callback for %r failed", key)
+
+    def on_change(self, key: str, callback: Callable[[Dict[str, Tuple[Any, Any]]], None]) -> Callable[[], None]:
+        """Subscribe to the changes of a value or a section made by reloads.
+
+        Args:
+            key: Configuration key, dotted path or section prefix to watch,
+                e.g. "database" for every value of the database section
+            callback: Called after a reload that changed a value under `key`,
+                with the (old, new) values of the changed paths keyed by dotted
+                path; a missing value is None. It runs in the reloading thread,
+                the watcher thread with `watch`, once the new configuration is
+                published; its exceptions are logged and the other callbacks
+                are still called.
+
+        Returns:
+            A function that cancels the subscription.
+
+        Example:
+            >>> unsubscribe = manager.on_change("database", lambda changes: pool.reset())
+        """
+        subscription = (key, callback)
+        self._subscribers.append(subscription)
+
+        def unsubscribe():
+            if subscription in self._subscribers:
+                self._subscribers.remove(subscription)
+
+        return unsubscribe
+
+    def share(self) -> int:
+        """Load the configuration and publish it to worker processes.
+
+        Call it in the master process of a pre-fork server. Workers, whose
+        settings.SHARED_FILE points to the same file, then map the published
+        configuration on their first lookup instead of parsing every file, and
+        `reload` in a worker picks up the latest generation. Every later
+        `reload` of the master that changes a file publishes a new generation,
+        so a reload costs one parse in total instead of one per worker.
+
+        The configuration is always read from its sources here, even when this
+        manager already loaded one, so that data attached from a shared file is
+        never published again. Shared files left by a previous run, or whose
+        master is gone, are ignored by every process.
+
+        Returns:
+            Generation of the published configuration
+
+        Raises:
+            ValueError: If settings.SHARED_FILE is not set
+        """
+        if not settings.SHARED_FILE:
+            raise ValueError("settings.SHARED_FILE is not set")
+
+        with self._write_lock:
+            self._sharing_pid = os.getpid()
+            self._artifact_fingerprint = None
+            self._load_sources()
+            self._files_checked = True
+            self._share()
+        self._call_stats_hooks()
+        return self._shared_generation
+
+    def _is_master(self) -> bool:
+        """Tell whether this process called `share`, rather than being forked from it."""
+        return self._sharing_pid == os.getpid()
+
+    def _share(self):
+        """Parse the pending files and write the configuration to settings.SHARED_FILE.
+
+        Note:
+            Must be called with _write_lock held.
+        """
+        from .shared import publish_shared
+
+        if self._pending:
+            layers, pending = dict(self._layers), dict(self._pending)
+            parse_pending(self._config_path, layers, pending, list(pending), self._parse_options())
+            self._publish(self._config_path, self._config_files, layers, pending)
+        self._shared_generation = publish_shared(
+            settings.SHARED_FILE, (self._config_path, self._config_files, self._layers)
+        )
+
+    def _attach_shared(self) -> Optional[Set[str]]:
+        """Publish the configuration shared by the master process, if it is newer.
+
+        Only the generation header is read when nothing changed; a new
+        generation is mapped and decoded once.
+
+        Returns:
+            Names of the files whose layer changed, or None when no configuration
+            was shared yet
+        """
+        from .shared import attach_shared, read_generation
+
+        generation = read_generation(settings.SHARED_FILE)
+        if generation is None:
+            return None
+        if generation == self._shared_generation:
+            return set()
+
+        shared = attach_shared(settings.SHARED_FILE)
+        if shared is None:
+            return None
+        generation, (path, config_files, layers) = shared
+        changed = self._changed_layers(layers)
+        self._publish(path, config_files, layers, {})
+        self._shared_generation = generation
+        return changed
+
+    def _changed_layers(self, layers: Dict) -> Set[str]:
+        """Names of the files whose layer differs between the published layers and `layers`."""
+        return {
+            file
+            for file in layers.keys() | self._layers.keys()
+            if file not in layers or file not in self._layers or layers[file][0] != self._layers[file][0]
+        }
+
+    def _load_artifact(self) -> Optional[Set[str]]:
+        """Publish the layers of settings.ARTIFACT, if it changed since the last load.
+
+        Returns:
+            Names of the files whose layer changed, empty when the artifact is
+            unchanged, or was loaded before and is now missing, in which case
+            the loaded configuration is kept. None when no artifact was loaded
+            and none can be: the files must be read instead.
+        """
+        from .artifact import load_artifact
+
+        try:
+            fingerprint = stat_fingerprint(settings.ARTIFACT)
+        except OSError:
+            fingerprint = None
+        if fingerprint is not None and fingerprint == self._artifact_fingerprint:
+            return set()
+
+        artifact = load_artifact(settings.ARTIFACT) if fingerprint is not None else None
+        if artifact is None:
+            return set() if self._artifact_fingerprint is not None else None
+        config_files, layers = artifact
+        changed = self._changed_layers(layers)
+        self._publish(self._config_dir(), config_files, layers, {})
+        self._artifact_fingerprint = fingerprint
+        return changed
+
+    def watch(self, interval: float = 1.0):
+        """Reload the configuration in the background whenever a file changes.
+
+        Uses inotify where available and falls back to polling file mtimes
+        every `interval` seconds; recursive trees are always polled. Calling it
+        again while a watcher runs is a no-op.
+
+        Args:
+            interval: Polling interval in seconds (default: 1.0)
+
+        Raises:
+            FileNotFoundError: When the configuration directory does not exist
+        """
+        if self._watcher_thread is not None:
+            return
+
+        from .watcher import make_watcher
+
+        self._load_config_files()
+        path = self._config_dir()
+        if path is None:
+            raise FileNotFoundError("No configuration directory to watch")
+
+        watcher = make_watcher(path, interval, settings.RECURSIVE, lambda: self._discover(path))
+        stop = threading.Event()
+        thread = threading.Thread(
+            target=self._watch_loop,
+            args=(watcher, stop),
+            name="ze-config-watcher",
+            daemon=True,
+        )
+        self._watcher_stop, self._watcher_thread = stop, thread
+        thread.start()
+
+    def _watch_loop(self, watcher: "PollingWatcher", stop: threading.Event):
+        """Body of the watcher thread: reload on every batch of changes."""
+        try:
+            while not stop.is_set():
+                if watcher.changes() and not stop.is_set():
+                    try:
+                        self.reload()
+                    except Exception:
+                        import logging
+
+                        logging.getLogger(__name__).exception(
+                            "Failed to reload configuration, keeping the previous one"
+                        )
+        finally:
+            watcher.close()
+
+    def stop_watching(self):
+        """Stop the background watcher started by `watch`, if any."""
+        thread = self._watcher_thread
+        if thread is None:
+            return
+
+        self._watcher_stop.set()
+        thread.join()
+        self._watcher_thread = self._watcher_stop = None
+
+    @_instance_or_default
+    def get(self, key: str, default: Optional[str] = None) -> Optional[str]:
         """Retrieve configuration value with error handling and lazy initialization.
 
         Args:
-            key: Configuration key to look up
+            key: Configuration key to look up. Nested values are reached with a
+                dotted path such as "database.primary.url".
             default: Fallback value if key not found (default: None)
 
         Returns:
-            Configuration value as string if found, default value if provided
+            Configuration value if found, default value if provided
 
         Raises:
-            ValueError: When key is not found and no default is provided
+            KeyError: When key is not found and no default is provided
 
         Note:
             Automatically triggers configuration loading on first access.
-            Uses colorama for colored terminal error messages.
+            Once loaded, a hit costs a single dictionary probe: the index is
+            empty until the first load, so the load check only runs on misses.
+            A dotted path is resolved in the nested sections on its first
+            lookup after each load and memoized in the index.
+        """
+        value = self._index.get(key, _MISSING)
+        if value is _MISSING:
+            if not self._files_checked:
+                self._load_config_files()
+                return self.get(key, default)
+            value = self._index.resolve(key, _MISSING)
+            if value is not _MISSING:
+                return value
+            if self._lazy_index and self._parse_pending(key):
+                return self.get(key, default)
+            if default is None:
+                raise KeyError(f"""Key: '{key}' not found or file non exists""")
+            return default
+        return value
+
+    def explain(self, key: str) -> Tuple[str, ...]:
+        """Tell where a configuration value comes from.
+
+        Args:
+            key: Configuration key or dotted path, as given to `get`
+
+        Returns:
+            The files, relative to the configuration directory, and environment
+            variables ("env:ZE_DATABASE__URL") that set the value or, for a
+            section, any value inside it, in merge order. Empty for a value no
+            source set, such as a schema default.
+
+        Raises:
+            KeyError: When key is not found
+
+        Example:
+            >>> manager.explain("database.url")
+            ('base/database.yaml', 'prod/database.yaml')
+        """
+        self.get(key)
+        return value_sources(self._provenance, key, self._config_files)
+
+    async def aload(self):
+        """Load the configuration without blocking the event loop.
+
+        Files are read and parsed in the default executor of the running loop.
+        Coroutines calling it concurrently all await the same load, so the
+        files are parsed once; if it fails, every caller gets the exception and
+        the next call tries again.
         """
-        if not cls._files_checked:
-            cls._load_config_files()
-        cls._load_config_files()
+        import asyncio
 
-        if cls._config_data.get(key, default) is None:
-            raise KeyError(f"""Key: '{key}' not found or file non exists""")
-        return cls._config_data.get(key, default)
+        loop = asyncio.get_running_loop()
+        task = self._load_task
+        if task is None or task.get_loop() is not loop:
+            if self._files_checked:
+                return
+            task = self._load_task = loop.run_in_executor(None, self._load_config_files)
+            task.add_done_callback(self._load_done)
+        # Shielded so that a cancelled caller does not cancel the shared load.
+        await asyncio.shield(task)
+
+    def _load_done(self, task: "asyncio.Future"):
+        """Forget the load started by `aload` once it is over."""
+        if self._load_task is task:
+            self._load_task = None
+
+    async def areload(self) -> Set[str]:
+        """Reload the configuration without blocking the event loop.
+
+        Returns:
+            Names of the files that were parsed again, added or removed
+        """
+        import asyncio
+
+        return await asyncio.get_running_loop().run_in_executor(None, self.reload)
+
+    async def aget(self, key: str, default: Optional[str] = None) -> Optional[str]:
+        """Retrieve a configuration value, loading it off the event loop if needed.
+
+        Args:
+            key: Configuration key, or dotted path to a nested value
+            default: Fallback value if key not found (default: None)
+
+        Returns:
+            Configuration value if found, default value if provided
+
+        Raises:
+            KeyError: When key is not found and no default is provided
+
+        Note:
+            Once loaded, a hit costs the same single dictionary probe as `get`
+            and never suspends. Lazily loaded files are parsed in the executor.
+        """
+        value = self._index.get(key, _MISSING)
+        if value is not _MISSING:
+            return value
+        await self.aload()
+        if self._lazy_index:
+            import asyncio
+
+            return await asyncio.get_running_loop().run_in_executor(None, self.get, key, default)
+        return self.get(key, default)
+
+    def stats(self) -> "LoadStats":
+        """Return the statistics of the configuration pipeline.
+
+        Returns:
+            Per-file read and parse timings, sizes and key counts, discovery and
+            publication timings of the last load, and lookup hit and miss counts.
+            They are only collected while settings.STATS is set.
+        """
+        if self._stats is None:
+            from .stats import LoadStats
+
+            self._stats = LoadStats()
+        return self._stats
+
+    def add_stats_hook(self, hook: Callable[["LoadStats"], None]):
+        """Register a callback receiving the statistics after every load.
+
+        Args:
+            hook: Called with the LoadStats once a load or reload is published,
+                while settings.STATS is set, e.g. to export them as metrics.
+                It runs in the loading thread once the lock is released, so it
+                may read the configuration.
+        """
+        self._stats_hooks.append(hook)
+
+    def _get_typed(self, key: str, kind: Hashable, convert: Callable[[Any], Any], default: Any) -> Any:
+        """Look up a key and convert it, caching the result until the next reload.
+
+        Args:
+            key: Configuration key to look up
+            kind: Memo discriminator of the conversion, e.g. "int"
+            convert: Function converting the raw value
+            default: Returned as-is, unconverted, when the key is not found
+
+        Raises:
+            KeyError: When key is not found and no default is provided
+            ValueError: When the value cannot be converted
+        """
+        memo = self._coerced
+        value = memo.get((key, kind), _MISSING)
+        if value is not _MISSING:
+            return value
+
+        if not self._files_checked:
+            self._load_config_files()
+            memo = self._coerced
+
+        raw = self.get(key, _MISSING)
+        if raw is _MISSING:
+            if default is None:
+                raise KeyError(f"""Key: '{key}' not found or file non exists""")
+            return default
+
+        try:
+            value = convert(raw)
+        except ValueError as error:
+            raise ValueError(f"Key: '{key}' {error}") from None
+        memo[(key, kind)] = value
+        return value
+
+    def get_int(self, key: str, default: Optional[int] = None) -> int:
+        """Retrieve a configuration value converted to an int.
+
+        Args:
+            key: Configuration key to look up
+            default: Fallback value if key not found (default: None)
+
+        Raises:
+            KeyError: When key is not found and no default is provided
+            ValueError: When the value is not a valid int
+        """
+        return self._get_typed(key, "int", to_int, default)
+
+    def get_bool(self, key: str, default: Optional[bool] = None) -> bool:
+        """Retrieve a configuration value converted to a bool.
+
+        Accepts booleans, 0/1 and the strings true/false, yes/no, on/off, t/f,
+        y/n, 1/0 in any case.
+
+        Args:
+            key: Configuration key to look up
+            default: Fallback value if key not found (default: None)
+
+        Raises:
+            KeyError: When key is not found and no default is provided
+            ValueError: When the value is not a valid bool
+        """
+        return self._get_typed(key, "bool", to_bool, default)
+
+    def get_list(self, key: str, default: Optional[Tuple] = None, separator: str = ",") -> Tuple:
+        """Retrieve a configuration value as a tuple of items.
+
+        Lists are returned as tuples, strings are split on `separator`.
+
+        Args:
+            key: Configuration key to look up
+            default: Fallback value if key not found (default: None)
+            separator: Item separator for string values (default: ",")
+
+        Raises:
+            KeyError: When key is not found and no default is provided
+            ValueError: When the value is neither a list nor a string
+        """
+        return self._get_typed(key, ("list", separator), lambda value: to_list(value, separator), default)
+
+    def get_duration(self, key: str, default: Optional[timedelta] = None) -> timedelta:
+        """Retrieve a configuration value converted to a timedelta.
+
+        Accepts numbers of seconds and strings such as "250ms", "30s" or "1h30m".
+
+        Args:
+            key: Configuration key to look up
+            default: Fallback value if key not found (default: None)
+
+        Raises:
+            KeyError: When key is not found and no default is provided
+            ValueError: When the value is not a valid duration
+        """
+        return self._get_typed(key, "duration", to_duration, default)
@@ -1,12 +1,10 @@
-import json
+import os
+import re
 from abc import ABC, abstractmethod
+from typing import IO, Any, Callable, Iterator, Optional, Set, Tuple
 
-import yaml
-
-try:
-    import tomllib
-except ImportError:
-    import tomli as tomllib
+# Parsing backends are imported on the first parse of their format, so
+# `from ze import config` does not pay for formats it never reads.
 
 
 class ConfigParser(ABC):
@@ -27,45 +25,449 @@ class ConfigParser(ABC):
         Returns:
             dict: Parsed configuration data.
         """
-        
+
+    @classmethod
+    def keys(cls, file_path: str) -> Optional[Set[str]]:
+        """
+        Lists the top-level keys of a configuration
+        file without fully parsing it.
+
+        Args:
+            file_path (str): Path to the
+            configuration file.
+
+        Returns:
+            Optional[Set[str]]: The top-level keys, or
+            None when the format has no cheap scan or the
+            file uses syntax the scan does not handle.
+            Callers must then parse the file.
+        """
+        return None
+
 
 class JSONParser(ConfigParser):
+    """
+    JSON parser. Files of at least `stream_threshold`
+    bytes are decoded one top-level member at a time,
+    so the text of the whole file is never held in
+    memory next to the parsed data. Streaming lowers
+    the peak memory by about the size of the file but
+    costs more time per top-level member: on a 32 MiB
+    file of 200k small sections, the peak dropped by
+    26% (104 vs 140 MiB) while parsing took 3 times as
+    long. Small and medium files therefore keep the
+    whole-document path below the 64 MiB default.
+
+    Attributes:
+        stream_threshold (Optional[int]): Size from
+        which files are streamed. None always reads
+        the whole file.
+        chunk_size (int): Number of characters read
+        at once when streaming.
+    """
+
+    stream_threshold: Optional[int] = 64 * 1024 * 1024
+    chunk_size = 1024 * 1024
+
+    _opening = re.compile(r"[ \t\n\r]*\{[ \t\n\r]*(\}?)")
+    _key = re.compile(r"[ \t\n\r]*\"")
+    _colon = re.compile(r"[ \t\n\r]*:[ \t\n\r]*")
+    _delimiter = re.compile(r"[ \t\n\r]*([,}])")
 
     @classmethod
     def parse(cls, file_path: str) -> dict:
         """Parses a JSON configuration file."""
+        import json
+
         with open(file_path, 'r', encoding='utf-8') as file:
-            return json.load(file)
+            if cls.stream_threshold is None or os.fstat(file.fileno()).st_size < cls.stream_threshold:
+                return json.load(file)
+            try:
+                return dict(cls._members(file))
+            except ValueError:
+                # Not an object or not valid JSON: let json report it.
+                file.seek(0)
+                return json.load(file)
+
+    @classmethod
+    def _members(cls, file: IO[str]) -> Iterator[Tuple[str, Any]]:
+        """
+        Decodes the members of a top-level JSON object.
+        Only the unread part of the current member is
+        buffered: a member cut by the end of the buffer
+        is decoded again once more text was read, the
+        read size doubling so that large members are
+        decoded a bounded number of times.
+
+        Raises:
+            ValueError: If the document is not an
+            object or is not valid JSON.
+        """
+        import json
+
+        decode = cls._member_decoder()
+        buffer, position, eof, closed = cls._open(file)
+        while not closed:
+            try:
+                key, value, delimiter, end = decode(buffer, position)
+            except (AttributeError, StopIteration, json.JSONDecodeError):
+                # A pattern did not match or the value is cut: read on.
+                if eof:
+                    raise ValueError("Invalid JSON object member.") from None
+                size = max(cls.chunk_size, len(buffer) - position)
+                chunk = file.read(size)
+                eof = len(chunk) < size
+                buffer, position = buffer[position:] + chunk, 0
+                continue
+            yield key, value
+            position, closed = end, delimiter == "}"
+
+        if buffer[position:].strip() or file.read().strip():
+            raise ValueError("Extra data after the JSON object.")
+
+    @classmethod
+    def _member_decoder(cls) -> Callable[[str, int], Tuple[str, Any, str, int]]:
+        """
+        Builds the function decoding the member that
+        starts at a position of the buffer. It returns
+        the key, the value, the delimiter that follows,
+        "," or "}", and the position after it, or raises
+        AttributeError, StopIteration or JSONDecodeError
+        when the member is invalid or cut by the end of
+        the buffer. Object keys are shared across
+        members, as `json.load` does within a document.
+        """
+        import json
+        from json.decoder import scanstring
+        from json.scanner import make_scanner
+
+        keys: dict = {}
+
+        def share_keys(pairs):
+            return {keys.setdefault(key, key): value for key, value in pairs}
+
+        scan = make_scanner(json.JSONDecoder(object_pairs_hook=share_keys))
+        match_key, match_colon, match_delimiter = cls._key.match, cls._colon.match, cls._delimiter.match
+
+        def decode(buffer: str, position: int) -> Tuple[str, Any, str, int]:
+            key, end = scanstring(buffer, match_key(buffer, position).end())
+            value, end = scan(buffer, match_colon(buffer, end).end())
+            member_end = match_delimiter(buffer, end)
+            return key, value, member_end.group(1), member_end.end()
+
+        return decode
+
+    @classmethod
+    def _open(cls, file: IO[str]) -> Tuple[str, int, bool, bool]:
+        """
+        Reads up to the opening brace of the document.
+
+        Returns:
+            Tuple[str, int, bool, bool]: The buffer, the
+            position after the brace, whether the file
+            was read to its end and whether the object
+            is already closed.
+
+        Raises:
+            ValueError: If the document is not an object.
+        """
+        buffer, eof = "", False
+        while True:
+            opening = cls._opening.match(buffer)
+            if opening or eof or buffer.strip():
+                break
+            chunk = file.read(cls.chunk_size)
+            eof = len(chunk) < cls.chunk_size
+            buffer += chunk
+        if opening is None:
+            raise ValueError("JSON document is not an object.")
+        return buffer, opening.end(), eof, opening.group(1) == "}"
+
+
+class ORJSONParser(ConfigParser):
+    """
+    JSON parser backed by orjson, an optional
+    dependency. Register it with
+    `ParserFactory.register('.json', ORJSONParser)`.
+    """
+
+    @classmethod
+    def parse(cls, file_path: str) -> dict:
+        """Parses a JSON configuration file."""
+        import orjson
+
+        with open(file_path, "rb") as file:
+            return orjson.loads(file.read())
 
 
 class TOMLParser(ConfigParser):
-    
+
+    _key_line = re.compile(r"([A-Za-z0-9_-]+)[ \t]*(?:\.[ \t]*[A-Za-z0-9_-]+[ \t]*)*=(.*)")
+    _table_line = re.compile(r"\[\[?[ \t]*([A-Za-z0-9_-]+)[ \t]*(?:\.[^\]\[]*)?\]\]?[ \t]*(?:#.*)?")
+
     @classmethod
     def parse(cls, file_path: str) -> dict:
-        """Parses a YAML configuration file."""
+        """Parses a TOML configuration file."""
+        try:
+            import tomllib
+        except ImportError:
+            import tomli as tomllib
+
         with open(file_path, "rb") as file:
             return tomllib.load(file)
 
+    @classmethod
+    def keys(cls, file_path: str) -> Optional[Set[str]]:
+        """
+        Scans the root keys and table names of a TOML
+        file. Files with multi-line strings, arrays or
+        quoted keys are not scanned.
+        """
+        with open(file_path, "r", encoding="utf-8") as file:
+            text = file.read()
+        if '"""' in text or "'''" in text:
+            return None
+
+        keys, in_root = set(), True
+        for raw_line in text.splitlines():
+            line = raw_line.strip()
+            if not line or line.startswith("#"):
+                continue
+            key = cls._key_line.fullmatch(line)
+            if key:
+                value = key.group(2)
+                if value.count("[") != value.count("]") or value.count("{") != value.count("}"):
+                    return None
+                if in_root:
+                    keys.add(key.group(1))
+                continue
+            table = cls._table_line.fullmatch(line)
+            if not table:
+                return None
+            keys.add(table.group(1))
+            in_root = False
+        return keys
+
+
+class RTOMLParser(TOMLParser):
+    """
+    TOML parser backed by rtoml, an optional
+    dependency. Register it with
+    `ParserFactory.register('.toml', RTOMLParser)`.
+    """
+
+    @classmethod
+    def parse(cls, file_path: str) -> dict:
+        """Parses a TOML configuration file."""
+        import rtoml
+
+        with open(file_path, "r", encoding="utf-8") as file:
+            return rtoml.load(file)
+
 
 class YAMLParser(ConfigParser):
-    
+    """
+    YAML parser that uses the libyaml based
+    CSafeLoader when PyYAML was built with it.
+
+    Files of at least `stream_threshold` bytes are
+    composed and constructed one top-level entry at a
+    time, so the node graph of the whole document is
+    never held in memory next to the parsed data.
+
+    Attributes:
+        pure_python (bool): Force the pure-Python
+        SafeLoader even when libyaml is available.
+        stream_threshold (Optional[int]): Size from
+        which files are streamed. None always loads
+        the whole document at once.
+    """
+
+    pure_python = False
+    stream_threshold: Optional[int] = 8 * 1024 * 1024
+
+    _top_level_line = re.compile(r"^[^ \t\r\n#].*", re.MULTILINE)
+    _key_line = re.compile(r"([A-Za-z_][\w.\-]*)[ \t]*:(?:[ \t].*)?")
+    _implicit_scalars = frozenset({"y", "n", "yes", "no", "true", "false", "on", "off", "null"})
+
+    @classmethod
+    def loader(cls) -> type:
+        """Returns the safe loader class to use."""
+        import yaml
+
+        if cls.pure_python:
+            return yaml.SafeLoader
+        return getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
     @classmethod
     def parse(cls, file_path: str) -> dict:
         """Parses a YAML configuration file."""
+        import yaml
+
         with open(file_path, "rb") as file:
-            return yaml.safe_load(file)
+            if cls.stream_threshold is not None and os.fstat(file.fileno()).st_size >= cls.stream_threshold:
+                config = cls._stream(file)
+                if config is not None:
+                    return config
+                file.seek(0)
+            return yaml.load(file, Loader=cls.loader())
+
+    @classmethod
+    def _stream(cls, file: IO[bytes]) -> Optional[dict]:
+        """
+        Loads a single-document YAML mapping entry by
+        entry. Only the nodes of the current entry and
+        the anchored ones stay referenced.
+
+        Returns:
+            Optional[dict]: The parsed data, or None
+            when the document is not a plain mapping,
+            has a top-level merge key or is followed
+            by other documents: it must then be loaded
+            as a whole.
+        """
+        import yaml
+        from yaml.composer import Composer
+
+        loader_class = cls.loader()
+        if not issubclass(loader_class, Composer):
+            # libyaml composes whole documents in C: compose entries in Python
+            # from its events instead.
+            loader_class = type(loader_class.__name__, (loader_class, Composer), {})
+        loader = loader_class(file)
+        loader.anchors = {}
+
+        try:
+            loader.get_event()
+            if not loader.check_event(yaml.DocumentStartEvent):
+                return None
+            loader.get_event()
+            if not loader.check_event(yaml.MappingStartEvent) or loader.peek_event().tag not in {None, "!"}:
+                return None
+            loader.get_event()
+
+            config = {}
+            constructed = loader.constructed_objects
+            while not loader.check_event(yaml.MappingEndEvent):
+                key_node = loader.compose_node(None, None)
+                value_node = loader.compose_node(None, None)
+                if key_node.tag == "tag:yaml.org,2002:merge":
+                    return None
+                key = loader.construct_object(key_node, deep=True)
+                try:
+                    config[key] = loader.construct_object(value_node, deep=True)
+                except TypeError:
+                    return None
+                if len(constructed) > len(loader.anchors):
+                    # Keep the objects of anchored nodes, so aliases share them.
+                    kept = {node: constructed[node] for node in loader.anchors.values() if node in constructed}
+                    constructed.clear()
+                    constructed.update(kept)
+
+            loader.get_event()
+            loader.get_event()
+            return config if loader.check_event(yaml.StreamEndEvent) else None
+        finally:
+            loader.dispose()
+
+    @classmethod
+    def keys(cls, file_path: str) -> Optional[Set[str]]:
+        """
+        Scans the keys of a block-style YAML mapping
+        from its unindented lines. Flow-style documents,
+        quoted or complex keys, anchors, merge keys,
+        multiple documents and keys YAML resolves to
+        non-strings are not scanned.
+        """
+        with open(file_path, "r", encoding="utf-8") as file:
+            text = file.read()
+
+        keys = set()
+        for number, raw_line in enumerate(cls._top_level_line.findall(text)):
+            line = raw_line.rstrip("\r")
+            if number == 0 and line.rstrip() == "---":
+                continue
+            key = cls._key_line.fullmatch(line)
+            if not key or key.group(1).lower() in cls._implicit_scalars:
+                return None
+            keys.add(key.group(1))
+        return keys
 
 
 class ENVParser(ConfigParser):
-    
+    """
+    Single-pass .env parser.
+
+    Reads the whole file as one buffer and tokenizes
+    it with a compiled pattern. Supports `export`
+    prefixes, single-quoted literal values,
+    double-quoted values with escapes, multi-line
+    quoted values and inline comments. Lines that
+    are not `KEY=value` assignments are skipped.
+    """
+
+    _entry = re.compile(
+        r"""
+        [ \t]*(?:export[ \t]+)?
+        (?P<key>[A-Za-z_][\w.\-]*)[ \t]*=[ \t]*
+        (?:
+            '(?P<single>[^']*)'[ \t]*(?:\#[^\r\n]*)?
+          | "(?P<double>(?:\\.|[^"\\])*)"[ \t]*(?:\#[^\r\n]*)?
+          | (?P<bare>[^\r\n]*?)(?:[ \t]+\#[^\r\n]*)?[ \t]*
+        )
+        (?:\r?\n|\Z)
+        """,
+        re.VERBOSE,
+    )
+    _escape = re.compile(r"""\\[\\'"abfnrtv]""")
+    _escapes = {
+        "\\\\": "\\",
+        "\\'": "'",
+        '\\"': '"',
+        "\\a": "\a",
+        "\\b": "\b",
+        "\\f": "\f",
+        "\\n": "\n",
+        "\\r": "\r",
+        "\\t": "\t",
+        "\\v": "\v",
+    }
+
     @classmethod
     def parse(cls, file_path: str) -> dict:
         """Parses a .env configuration file."""
+        with open(file_path, "r", encoding="utf-8-sig") as file:
+            return cls.loads(file.read())
+
+    @classmethod
+    def loads(cls, text: str) -> dict:
+        """Parses the content of a .env file."""
         config = {}
-        with open(file_path, 'r') as file:
-            for line in file:
-                line = line.strip()
-                if line and not line.startswith('#'):
-                    key, value = line.split('=', 1)
-                    config[key] = value
-        return config
\ No newline at end of file
+        match_entry = cls._entry.match
+        position, end = 0, len(text)
+
+        while position < end:
+            entry = match_entry(text, position)
+            if entry is None:
+                # Blank, comment or malformed line: skip it.
+                position = text.find("\n", position)
+                if position < 0:
+                    break
+                position += 1
+                continue
+
+            key, single, double, bare = entry.group("key", "single", "double", "bare")
+            if single is not None:
+                config[key] = single
+            elif double is not None:
+                config[key] = cls._unescape(double) if "\\" in double else double
+            else:
+                config[key] = bare
+            position = entry.end()
+
+        return config
+
+    @classmethod
+    def _unescape(cls, value: str) -> str:
+        """Decodes the escapes of a double-quoted value."""
+        return cls._escape.sub(lambda escape: cls._escapes[escape.group()], value)
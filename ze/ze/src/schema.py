@@ -0,0 +1,238 @@
+import dataclasses
+import types
+import typing
+from datetime import timedelta
+from typing import Any, Callable, Dict, FrozenSet, List, NamedTuple, Optional, Tuple
+
+from .converters import to_bool, to_duration, to_float, to_int, to_list
+
+_MISSING = object()
+
+# Conversions applied to string values, typically set through environment
+# variables or .env files, when the declared type is not a string.
+CONVERTERS: Dict[type, Callable[[Any], Any]] = {
+    int: to_int,
+    float: to_float,
+    bool: to_bool,
+    timedelta: to_duration,
+    tuple: to_list,
+    list: to_list,
+}
+
+
+class Field:
+    """Declaration of a configuration key in a dict schema.
+
+    Args:
+        kind (Any): Expected type: a class, a typing construct such as
+        Optional[int] or List[str], a nested dict schema or a dataclass.
+        Defaults to Any, which accepts every value.
+        default (Any): Value used when the key is missing. Without a default
+        the key is required.
+    """
+
+    __slots__ = ('kind', 'default')
+
+    def __init__(self, kind: Any = Any, default: Any = _MISSING):
+        self.kind = kind
+        self.default = default
+
+
+class _Rule(NamedTuple):
+    """Compiled check of one key."""
+
+    key: str
+    path: str
+    kinds: Tuple[type, ...] = ()
+    nullable: bool = False
+    default: Any = _MISSING
+    factory: Optional[Callable[[], Any]] = None
+    convert: Optional[Callable[[Any], Any]] = None
+    children: Optional[Tuple["_Rule", ...]] = None
+
+
+class Schema:
+    """Validator of the merged configuration, compiled once from a declaration.
+
+    The declaration is either a dict mapping each key to a type, a Field or a
+    nested dict, or a dataclass whose fields, with their annotations and
+    defaults, declare the keys; nested dataclasses declare sections.
+
+    Args:
+        spec (Any): Dict schema or dataclass.
+
+    Raises:
+        TypeError: If the declaration is neither a dict nor a dataclass.
+
+    Example:
+        >>> schema = Schema({'PORT': int, 'database': {'url': str, 'pool': Field(int, 5)}})
+        >>> schema.validate({'PORT': '8080', 'database': {'url': 'postgres://'}})
+        {'PORT': 8080, 'database': {'url': 'postgres://', 'pool': 5}}
+    """
+
+    def __init__(self, spec: Any):
+        self._rules = _compile(spec, '')
+        self.keys: FrozenSet[str] = frozenset(rule.key for rule in self._rules)
+
+    def validate(self, config_data: Dict) -> Dict:
+        """Check configuration data against the schema.
+
+        Args:
+            config_data (Dict): Merged configuration data, left unchanged.
+
+        Returns:
+            Dict: The data with the defaults of the missing keys filled in and
+            string values converted to the declared types. Sections that need
+            no change are shared with `config_data`.
+
+        Raises:
+            ValueError: Listing every missing key and invalid value.
+        """
+        errors: List[str] = []
+        validated = _check(self._rules, config_data, errors)
+        if errors:
+            raise ValueError('Invalid configuration:\n' + '\n'.join(f'- {error}' for error in errors))
+        return validated
+
+
+def _kinds(kind: Any) -> Tuple[Tuple[type, ...], bool]:
+    """Expand a declared type into the accepted classes and nullability."""
+    if kind is Any or kind is object:
+        return (), False
+    origin = typing.get_origin(kind)
+    if origin is typing.Union or origin is types.UnionType:
+        return _union_kinds(kind)
+    if origin is not None:
+        kind = origin
+    if not isinstance(kind, type):
+        return (), False
+    if kind is float:
+        return (float, int), False
+    if kind in {list, tuple}:
+        return (list, tuple), False
+    return (kind,), False
+
+
+def _union_kinds(kind: Any) -> Tuple[Tuple[type, ...], bool]:
+    """Expand a Union or `X | Y` type, None making it nullable."""
+    kinds, nullable = [], False
+    for arg in typing.get_args(kind):
+        if arg is type(None):
+            nullable = True
+            continue
+        arg_kinds, _ = _kinds(arg)
+        if not arg_kinds:
+            return (), nullable
+        kinds.extend(arg_kinds)
+    return tuple(kinds), nullable
+
+
+def _is_section(kind: Any) -> bool:
+    return isinstance(kind, dict) or (isinstance(kind, type) and dataclasses.is_dataclass(kind))
+
+
+def _declarations(spec: Any) -> List[Tuple[str, Any, Any, Optional[Callable[[], Any]]]]:
+    """List the (key, kind, default, default factory) declarations of a dict schema or dataclass."""
+    if isinstance(spec, dict):
+        declarations = []
+        for key, value in spec.items():
+            if isinstance(value, Field):
+                declarations.append((key, value.kind, value.default, None))
+            else:
+                declarations.append((key, value, _MISSING, None))
+        return declarations
+
+    if isinstance(spec, type) and dataclasses.is_dataclass(spec):
+        hints = typing.get_type_hints(spec)
+        declarations = []
+        for field in dataclasses.fields(spec):
+            default = _MISSING if field.default is dataclasses.MISSING else field.default
+            factory = None if field.default_factory is dataclasses.MISSING else field.default_factory
+            declarations.append((field.name, hints.get(field.name, Any), default, factory))
+        return declarations
+
+    raise TypeError(f'Schema must be a dict or a dataclass, got {type(spec).__name__}.')
+
+
+def _compile(spec: Any, prefix: str) -> Tuple[_Rule, ...]:
+    """Compile a declaration into rules, nested sections included."""
+    rules = []
+    for key, kind, default, factory in _declarations(spec):
+        path = f'{prefix}{key}'
+        if _is_section(kind):
+            rules.append(_Rule(key, path, children=_compile(kind, f'{path}.')))
+            continue
+        kinds, nullable = _kinds(kind)
+        convert = None
+        if str not in kinds:
+            convert = next((CONVERTERS[accepted] for accepted in kinds if accepted in CONVERTERS), None)
+        rules.append(_Rule(key, path, kinds, nullable or default is None, default, factory, convert))
+    return tuple(rules)
+
+
+def _check(rules: Tuple[_Rule, ...], section: Dict, errors: List[str]) -> Dict:
+    """Validate a section, returning it, or a copy when a value was filled in or converted."""
+    updates = {}
+    for rule in rules:
+        value = section.get(rule.key, _MISSING)
+
+        if rule.children is not None:
+            if value is _MISSING:
+                value = {}
+            elif not isinstance(value, dict):
+                errors.append(f'{rule.path}: expected a section, got {type(value).__name__}')
+                continue
+            checked = _check(rule.children, value, errors)
+            if checked is not value or rule.key not in section:
+                updates[rule.key] = checked
+            continue
+        _check_value(rule, value, updates, errors)
+
+    if not updates:
+        return section
+    section = dict(section)
+    section.update(updates)
+    return section
+
+
+def _check_value(rule: _Rule, value: Any, updates: Dict, errors: List[str]):
+    """Validate the value of a key, storing a filled in or converted one in `updates`."""
+    if value is _MISSING:
+        if rule.factory is not None:
+            updates[rule.key] = rule.factory()
+        elif rule.default is not _MISSING:
+            updates[rule.key] = rule.default
+        else:
+            errors.append(f'{rule.path}: missing required key')
+        return
+
+    if value is None:
+        if not rule.nullable:
+            errors.append(f'{rule.path}: must not be null')
+        return
+
+    if not rule.kinds or (isinstance(value, rule.kinds) and (type(value) is not bool or bool in rule.kinds)):
+        return
+
+    if rule.convert is not None and isinstance(value, str):
+        try:
+            updates[rule.key] = rule.convert(value)
+        except ValueError as error:
+            errors.append(f'{rule.path}: {error}')
+        return
+    expected = ' or '.join(kind.__name__ for kind in rule.kinds)
+    errors.append(f'{rule.path}: expected {expected}, got {type(value).__name__} {value!r}')
+
+
+def compile_schema(spec: Any) -> Optional[Schema]:
+    """Compile a schema declaration, passing compiled schemas and None through.
+
+    Args:
+        spec (Any): Dict schema, dataclass, Schema or None.
+
+    Returns:
+        Optional[Schema]: The compiled schema, or None.
+    """
+    if spec is None or isinstance(spec, Schema):
+        return spec
+    return Schema(spec)
@@ -1,6 +1,6 @@
 import os
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Tuple
 
 
 class Settings:
@@ -13,6 +13,50 @@ class Settings:
             derived from this file's location. Initialized at module load time.
         CONF_DIR (Optional[str]): Absolute path to the configuration directory,
             located under the base directory. Defaults to 'configs' subdirectory.
+        CACHE_FILE (Optional[str]): Path of the on-disk snapshot of the merged
+            configuration. Disabled when None (default).
+        ARTIFACT (Optional[str]): Path of a precompiled artifact built with
+            `python -m ze compile`. When the file exists, it replaces the
+            configuration directory: loads read the files and layers from it
+            without discovering or parsing anything, and reloads only pick up
+            a new artifact. Disabled when None (default).
+        PARSE_WORKERS (int): Number of workers used to parse configuration
+            files in parallel. 0 parses them sequentially (default).
+        PARSE_EXECUTOR (str): Pool used for parallel parsing, 'thread' or
+            'process'. Defaults to 'thread'.
+        LAZY_LOAD (bool): Only scan the top-level keys of the configuration
+            files on load and parse each file on the first lookup of one of
+            its keys. Defaults to False.
+        RECURSIVE (bool): Also discover configuration files in subdirectories
+            of the configuration directory. Defaults to False.
+        INCLUDE (Tuple[str, ...]): Glob patterns, matched against paths relative
+            to the configuration directory, of the files to load. Defaults to all.
+        EXCLUDE (Tuple[str, ...]): Glob patterns of the files and directories
+            to skip. Defaults to '.git' and '__pycache__'.
+        LAYERS (Tuple[str, ...]): Glob patterns of the precedence layers, lowest
+            first, e.g. ('*/base/*', '*/prod/*', '*/local/*'). Files matching no
+            layer are loaded first. Defaults to no layers.
+        FREEZE (bool): Freeze the loaded configuration into read-only, compact
+            sections (FrozenDict and tuples) and call `gc.freeze()` once after
+            the first load, so that forked workers share it with the parent.
+            Defaults to False.
+        SHARED_FILE (Optional[str]): Path of the file a master process publishes
+            the loaded configuration to with `ConfigManager.share()`, and that
+            worker processes load it from. A file published before the process
+            imported ze, or by a master that exited, is ignored. Disabled when
+            None (default).
+        ENV_PREFIX (Optional[str]): Prefix of the environment variables that
+            override configuration values on every load, '__' separating the
+            segments of a nested key: with 'ZE_', ZE_DATABASE__URL overrides
+            'database.url'. Disabled when None (default).
+        STATS (bool): Collect load timings per file and lookup counters, see
+            `ConfigManager.stats()`. Defaults to False.
+        MERGE_DICTS (str): How a later file merges a section defined by an
+            earlier one: 'replace' it whole (default) or 'merge' it key by key,
+            recursively.
+        MERGE_LISTS (str): How a later file merges a list defined by an earlier
+            one: 'replace' it (default), 'append' its items, or append the
+            'unique' items not present yet.
 
     Note:
         Paths are resolved at class definition time and will not dynamically
@@ -21,6 +65,21 @@ class Settings:
 
     BASE_DIR: Optional[str] = Path(__file__).resolve().parent
     CONF_DIR: Optional[str] = os.path.join(Path(__file__).resolve().parent, 'configs')
+    CACHE_FILE: Optional[str] = None
+    ARTIFACT: Optional[str] = None
+    PARSE_WORKERS: int = 0
+    PARSE_EXECUTOR: str = 'thread'
+    LAZY_LOAD: bool = False
+    RECURSIVE: bool = False
+    INCLUDE: Tuple[str, ...] = ('*',)
+    EXCLUDE: Tuple[str, ...] = ('.git', '__pycache__')
+    LAYERS: Tuple[str, ...] = ()
+    FREEZE: bool = False
+    SHARED_FILE: Optional[str] = None
+    ENV_PREFIX: Optional[str] = None
+    STATS: bool = False
+    MERGE_DICTS: str = 'replace'
+    MERGE_LISTS: str = 'replace'
 
 
 settings: Settings = Settings()
@@ -0,0 +1,107 @@
+import mmap
+import os
+import pickle
+import struct
+import time
+from typing import Any, AnyStr, Optional, Tuple
+
+_MAGIC = b'ZECONF02'
+# Magic, generation, pid of the publishing process and publication time in ns.
+_HEADER = struct.Struct('<8sQQQ')
+
+# Start of this run: set when the master imports the module and inherited by
+# the workers it forks, so that files left over by a previous run are ignored.
+_RUN_START = time.time_ns()
+
+
+def _is_live(pid: int, published: int) -> bool:
+    """Tell whether a file was published during this run by a process still alive."""
+    if published < _RUN_START:
+        return False
+    if pid == os.getpid() or os.name != 'posix':
+        return True
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        pass
+    return True
+
+
+def _unpack_header(header: bytes) -> Optional[int]:
+    """Return the generation of a header, or None when it is invalid or stale."""
+    magic, generation, pid, published = _HEADER.unpack_from(header)
+    return generation if magic == _MAGIC and _is_live(pid, published) else None
+
+
+def read_generation(share_path: AnyStr) -> Optional[int]:
+    """Read the generation of a shared configuration file.
+
+    Args:
+        share_path (AnyStr): Path of the shared file.
+
+    Returns:
+        Optional[int]: The generation, or None when the file is missing, is
+        not a shared configuration file, or is stale: published before this
+        run started or by a process that is no longer alive.
+    """
+    try:
+        with open(share_path, 'rb') as file:
+            header = file.read(_HEADER.size)
+    except OSError:
+        return None
+    if len(header) < _HEADER.size:
+        return None
+    return _unpack_header(header)
+
+
+def publish_shared(share_path: AnyStr, data: Any) -> int:
+    """Publish configuration data to the processes sharing a file.
+
+    Args:
+        share_path (AnyStr): Path of the shared file.
+        data (Any): Configuration data to publish.
+
+    Returns:
+        int: The new generation, one more than the published one, or 1 when
+        the file is missing or stale.
+
+    Note:
+        The file is written aside and renamed into place, so readers map either
+        the previous or the new generation, never a partial one. Like snapshots,
+        the data is pickled: the file must only be writable by the application.
+    """
+    generation = (read_generation(share_path) or 0) + 1
+    tmp_path = f'{os.fspath(share_path)}.{os.getpid()}.tmp'
+    try:
+        with open(tmp_path, 'wb') as file:
+            file.write(_HEADER.pack(_MAGIC, generation, os.getpid(), time.time_ns()))
+            pickle.dump(data, file, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, share_path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    return generation
+
+
+def attach_shared(share_path: AnyStr) -> Optional[Tuple[int, Any]]:
+    """Map a shared configuration file and decode its data.
+
+    Args:
+        share_path (AnyStr): Path of the shared file.
+
+    Returns:
+        Optional[Tuple[int, Any]]: The generation and the data, or None when
+        no valid file was published during this run by a live process.
+    """
+    try:
+        with open(share_path, 'rb') as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            generation = _unpack_header(mapped)
+            if generation is None:
+                return None
+            with memoryview(mapped) as view:
+                return generation, pickle.loads(view[_HEADER.size:])
+    except (OSError, ValueError, struct.error, EOFError, pickle.UnpicklingError):
+        return None
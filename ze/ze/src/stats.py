@@ -0,0 +1,93 @@
+from typing import Any, Dict, List, NamedTuple
+
+from .core import PathIndex
+
+
+class FileStats(NamedTuple):
+    """Load statistics of one configuration file.
+
+    Attributes:
+        file (str): Path of the file.
+        size (int): Size of the file in bytes.
+        keys (int): Number of keys, nested ones included.
+        read_seconds (float): Time spent reading the file.
+        parse_seconds (float): Time spent parsing the file once read.
+    """
+
+    file: str
+    size: int
+    keys: int
+    read_seconds: float
+    parse_seconds: float
+
+
+class LoadStats:
+    """Statistics of the configuration pipeline, collected when settings.STATS is set.
+
+    Attributes:
+        loads (int): Number of loads and reloads published so far.
+        discovery_seconds (float): Time the last load spent discovering files.
+        publish_seconds (float): Time the last load spent merging and indexing.
+        files (Dict[str, FileStats]): Statistics of every loaded file, from its
+            last parse, keyed by absolute path. Files served from a snapshot, a
+            shared file or the parse cache, or still pending in lazy mode, have
+            no entry.
+        hits (int): Lookups found in the index.
+        misses (int): Lookups missing from the index.
+    """
+
+    def __init__(self):
+        self.loads = 0
+        self.discovery_seconds = 0.0
+        self.publish_seconds = 0.0
+        self.files: Dict[str, FileStats] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def slowest(self, count: int = 5) -> List[FileStats]:
+        """Return the files that took the longest to read and parse.
+
+        Args:
+            count (int): Number of files to return.
+
+        Returns:
+            List[FileStats]: The slowest files, slowest first.
+        """
+        return sorted(
+            self.files.values(), key=lambda stats: stats.read_seconds + stats.parse_seconds, reverse=True
+        )[:count]
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return the statistics as plain data, e.g. to export them as metrics."""
+        return {
+            'loads': self.loads,
+            'discovery_seconds': self.discovery_seconds,
+            'publish_seconds': self.publish_seconds,
+            'files': {file: stats._asdict() for file, stats in self.files.items()},
+            'hits': self.hits,
+            'misses': self.misses,
+        }
+
+
+class CountingIndex(PathIndex):
+    """Dotted-path index that counts the lookups made through `get`.
+
+    Only published when statistics are enabled, so lookups pay for the
+    counters only then. Counters are not locked and may miss a few updates
+    under heavy contention.
+    """
+
+    __slots__ = ('stats',)
+
+    def __init__(self, config_data: Dict, stats: LoadStats):
+        super().__init__(config_data)
+        self.stats = stats
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        try:
+            value = self[key]
+        except KeyError:
+            self.stats.misses += 1
+            return default
+        self.stats.hits += 1
+        return value
@@ -0,0 +1,26 @@
+import time
+from typing import Callable
+
+
+def best_of(function: Callable[[], object], repeat: int) -> float:
+    """Measure the best wall-clock time of repeated calls.
+
+    Args:
+        function (Callable[[], object]): Function to time, called without
+        arguments.
+        repeat (int): Number of timed calls, at least 1.
+
+    Returns:
+        float: The shortest call, in seconds.
+
+    Raises:
+        ValueError: If `repeat` is below 1.
+    """
+    if repeat < 1:
+        raise ValueError(f'repeat must be at least 1, got {repeat}')
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
@@ -0,0 +1,162 @@
+import ctypes
+import ctypes.util
+import os
+import select
+import sys
+import time
+from typing import AnyStr, Callable, Dict, List, Optional, Set, Tuple
+
+from .core import is_config_file
+
+IN_MODIFY = 0x00000002
+IN_ATTRIB = 0x00000004
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_MASK = IN_MODIFY | IN_ATTRIB | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE
+
+
+class PollingWatcher:
+    """Detects changed configuration files by polling their mtimes.
+
+    Attributes:
+        path (AnyStr): Directory being watched.
+        interval (float): Seconds between two polls.
+    """
+
+    def __init__(self, path: AnyStr, interval: float = 1.0, discover: Optional[Callable[[], List[str]]] = None):
+        """
+        Args:
+            path (AnyStr): Directory to watch.
+            interval (float): Seconds between two polls.
+            discover (Optional[Callable[[], List[str]]]): Returns the paths,
+            relative to `path`, of the files to watch. Defaults to the files
+            directly inside `path`.
+        """
+        self.path = path
+        self.interval = interval
+        self._discover = discover
+        self._stats = self._scan()
+
+    def _scan(self) -> Dict[str, Tuple[int, int, int]]:
+        """Stat every configuration file being watched, following symlinks."""
+        try:
+            if self._discover is None:
+                names = [entry.name for entry in os.scandir(self.path) if entry.is_file()]
+            else:
+                names = self._discover()
+        except FileNotFoundError:
+            return {}
+        stats = {}
+        for name in names:
+            if is_config_file(name):
+                try:
+                    stat = os.stat(os.path.join(self.path, name))
+                except FileNotFoundError:
+                    continue
+                stats[name] = (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+        return stats
+
+    def _rescan(self) -> Set[str]:
+        """Stat the watched files again and return the ones that changed."""
+        stats = self._scan()
+        changed = {name for name in stats.keys() | self._stats.keys() if stats.get(name) != self._stats.get(name)}
+        self._stats = stats
+        return changed
+
+    def changes(self) -> Set[str]:
+        """Wait for one polling interval.
+
+        Returns:
+            Set[str]: Names of the files that were modified, added or removed
+            since the previous call.
+        """
+        time.sleep(self.interval)
+        return self._rescan()
+
+    def close(self):
+        """Release the resources held by the watcher."""
+
+
+class InotifyWatcher(PollingWatcher):
+    """Detects changed configuration files through Linux inotify.
+
+    Blocks in the kernel until the directory changes instead of polling it,
+    `interval` only bounds how long a single `changes()` call may wait.
+    Events only wake the watcher up, the files are then stat'ed again, so a
+    symlink swap such as the Kubernetes `..data` rotation is detected even
+    though no event names the configuration file itself.
+    """
+
+    def __init__(self, path: AnyStr, interval: float = 1.0):
+        super().__init__(path, interval)
+        libc = _libc()
+        self._fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self._fd < 0:
+            raise OSError(ctypes.get_errno(), 'inotify_init1 failed')
+        if libc.inotify_add_watch(self._fd, os.fsencode(path), IN_MASK) < 0:
+            errno = ctypes.get_errno()
+            os.close(self._fd)
+            raise OSError(errno, f'inotify_add_watch failed for {path!r}')
+
+    def changes(self) -> Set[str]:
+        """Wait up to one interval for inotify events.
+
+        Returns:
+            Set[str]: Names of the configuration files that changed.
+        """
+        ready, _, _ = select.select([self._fd], [], [], self.interval)
+        if not ready:
+            return set()
+
+        # Editors and deploy tools usually write in several steps, give them
+        # a moment to finish before reporting the batch.
+        time.sleep(0.05)
+        while True:
+            try:
+                os.read(self._fd, 64 * 1024)
+            except BlockingIOError:
+                break
+        return self._rescan()
+
+    def close(self):
+        """Close the inotify file descriptor."""
+        os.close(self._fd)
+
+
+def _libc() -> ctypes.CDLL:
+    """Load the C library exposing the inotify functions."""
+    return ctypes.CDLL(ctypes.util.find_library('c'), use_errno=True)
+
+
+def make_watcher(
+    path: AnyStr,
+    interval: float = 1.0,
+    recursive: bool = False,
+    discover: Optional[Callable[[], List[str]]] = None,
+) -> PollingWatcher:
+    """Create the best watcher available on this platform.
+
+    Args:
+        path (AnyStr): Directory to watch.
+        interval (float): Polling interval, or the longest time a single wait
+        may block when inotify is used.
+        recursive (bool): Watch the whole tree below `path`.
+        discover (Optional[Callable[[], List[str]]]): Returns the relative paths
+        of the files to watch in a recursive tree.
+
+    Returns:
+        PollingWatcher: An InotifyWatcher on Linux for a single directory, a
+        PollingWatcher for recursive trees, on other platforms or when inotify
+        cannot be initialised.
+    """
+    if recursive:
+        return PollingWatcher(path, interval, discover)
+    if sys.platform.startswith('linux'):
+        try:
+            return InotifyWatcher(path, interval)
+        except (OSError, AttributeError):
+            pass
+    return PollingWatcher(path, interval)